@@ -4,21 +4,33 @@
 
 from .__version__ import *
 from ._arrangement import *
+from ._astore import *
+from ._compact import *
 from ._discrete_tune import *
+from ._edits import *
+from ._gc import *
+from ._history import *
 from ._holistic import *
 from ._instrument import *
 from ._intensity import *
+from ._intern import *
 from ._map import *
 from ._setable import *
 from ._note import *
 from ._offset import *
 from ._open import *
+from ._packed import *
 from ._rename import *
+from ._replay import *
+from ._report import *
 from ._setpoint import *
+from ._shared import *
+from ._snapshot import *
 from ._store import *
 from ._tune import *
 from ._tune_test import *
 from ._update_merge import *
+from ._watch import *
 from .io import *
 
 from . import _cli
@@ -5,14 +5,17 @@ from typing import Dict, Union
 
 import numpy as np
 
+from ._intern import _intern
+from ._lazy import LazyDict
 from ._tune import Tune
 from ._discrete_tune import DiscreteTune
 
 
 def mktune(dict_):
+    # serialized tunes are shared with equal tunes already in use
     if "ranges" in dict_:
-        return DiscreteTune(**dict_)
-    return Tune(**dict_)
+        return _intern(DiscreteTune(**dict_))
+    return _intern(Tune(**dict_))
 
 
 class Arrangement:
@@ -34,9 +37,8 @@ class Arrangement:
             Mapping of names to Tune objects which compose the Arrangement
         """
         self._name: str = name
-        self._tunes: Dict[str, Union[DiscreteTune, Tune]] = {
-            k: mktune(v) if isinstance(v, dict) else v for k, v in tunes.items()
-        }
+        # serialized tunes are built when first accessed
+        self._tunes: Dict[str, Union[DiscreteTune, Tune]] = LazyDict(tunes, mktune)
         self._ind_units: str = "nm"
 
     def _print_tunes(self, prefix):
@@ -52,7 +54,7 @@ class Arrangement:
         return f"Arrangement({repr(self.name)}, {repr(self.tunes)})"
 
     def __getitem__(self, key):
-        return self.tunes[key]
+        return self._tunes[key]
 
     def __eq__(self, other):
         if self.name != other.name:
@@ -61,6 +63,13 @@ class Arrangement:
             return False
         return True
 
+    def __getstate__(self):
+        # tunes which were never used are sent in their serialized form
+        return {"name": self._name, "tunes": dict(self._tunes._items)}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
     @property
     def independent(self):
         """Returns a 1-dimensional numpy array with the set of all unique independent points.
@@ -81,7 +90,7 @@ class Arrangement:
 
     def keys(self):
         """Return the names of the tunes in the arrangment."""
-        return self.tunes.keys()
+        return self._tunes.keys()
 
     def values(self):
         """Return the tunes in the arrangment."""
@@ -116,4 +125,4 @@ class Arrangement:
     @property
     def tunes(self):
         """The tunes in the arrangement."""
-        return self._tunes
+        return self._tunes.built()
@@ -0,0 +1,139 @@
+"""asyncio counterparts to the attune store functions."""
+
+__all__ = ["aload", "astore", "arestore", "awatch"]
+
+import asyncio
+import functools
+
+from . import _store, _watch
+
+_inflight = {}
+
+
+def _retrieve(future):
+    # the result of a shared load may be abandoned by every waiter, do not warn about it
+    if not future.cancelled():
+        future.exception()
+
+
+async def aload(name: str, time=None, reverse: bool = True):
+    """Load an instrument without blocking the event loop.
+
+    The file system access, time parsing and decoding of :meth:`attune.load` run in the
+    default executor of the running loop.
+    Concurrent calls with the same arguments share a single load, and receive the same
+    (immutable) Instrument object.
+    Cancelling one caller does not affect the others awaiting the same load.
+
+    Parameters
+    ----------
+    name: str
+        The key of the instrument to load
+    time: str, datetime, optional
+        The time for which to load the instrument, see :meth:`attune.load`.
+    reverse: boolean, optional
+        Direction to search, see :meth:`attune.load`.
+    """
+    loop = asyncio.get_running_loop()
+    key = (loop, _store._store_dir(), name, time, reverse)
+    future = _inflight.get(key)
+    if future is None:
+        future = loop.run_in_executor(None, _store.load, name, time, reverse)
+        _inflight[key] = future
+        future.add_done_callback(_retrieve)
+        future.add_done_callback(lambda f: _inflight.pop(key, None))
+    return await asyncio.shield(future)
+
+
+async def astore(instrument, warn=True, *, compression=None, format=None, defer_data=False):
+    """Store an instrument without blocking the event loop.
+
+    :meth:`attune.store` runs in the default executor of the running loop.
+    Store writes are atomic: if the calling task is cancelled, the write which is already
+    underway still completes (or fails) as a whole, in the background.
+
+    Parameters
+    ----------
+    instrument: Instrument
+        The instrument to store.
+    warn: bool
+        Whether or not to warn if the store is equivalent to the current head.
+    compression: str, optional
+        Codec used to compress the written files, see :meth:`attune.store`.
+    format: str, optional
+        Encoding of the tune objects, see :meth:`attune.store`.
+    defer_data: bool
+        Write the transition data in the background, see :meth:`attune.store`.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(
+        _store.store,
+        instrument,
+        warn,
+        compression=compression,
+        format=format,
+        defer_data=defer_data,
+    )
+    future = loop.run_in_executor(None, call)
+    future.add_done_callback(_retrieve)
+    await asyncio.shield(future)
+
+
+async def arestore(name, time, reverse=True, *, compression=None, format=None):
+    """Restore a previously applied instrument without blocking the event loop.
+
+    :meth:`attune.restore` runs in the default executor of the running loop, with the same
+    cancellation behavior as :meth:`attune.astore`.
+
+    Parameters
+    ----------
+    name: str
+        The key of the instrument to restore
+    time: str, datetime
+        The time for which to load the instrument, see :meth:`attune.restore`.
+    reverse: boolean, optional
+        Direction to search, see :meth:`attune.restore`.
+    compression: str, optional
+        Codec used to compress the written files, see :meth:`attune.store`.
+    format: str, optional
+        Encoding of the written files, see :meth:`attune.store`.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(
+        _store.restore, name, time, reverse, compression=compression, format=format
+    )
+    future = loop.run_in_executor(None, call)
+    future.add_done_callback(_retrieve)
+    await asyncio.shield(future)
+
+
+async def awatch(name: str, *, interval: float = 1.0):
+    """Iterate over each new head of an instrument in the store, as it is stored.
+
+    An asynchronous iterator counterpart to :meth:`attune.watch`, sharing its polling
+    thread (and loaded Instrument objects) with every other watch of the instrument.
+    Heads stored while the consumer is busy are queued, not skipped.
+    The watch ends when the iteration is left (e.g. by ``break``).
+
+    .. code-block:: python
+
+        async for instr in attune.awatch("opa1"):
+            print(instr.load)
+
+    Parameters
+    ----------
+    name: str
+        The key of the instrument to watch.
+    interval: float, optional
+        Seconds between polls, default is 1.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    subscription = _watch.watch(
+        name, lambda instr: loop.call_soon_threadsafe(queue.put_nowait, instr), interval=interval
+    )
+    try:
+        while True:
+            yield await queue.get()
+    finally:
+        subscription.stop()
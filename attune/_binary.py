@@ -0,0 +1,92 @@
+"""Binary container for serialized instruments and tunes.
+
+The layout is a JSON header followed by contiguous little-endian float64 blocks::
+
+    magic (8 bytes) | header length (uint64 LE) | JSON header | padding | blocks
+
+The header is the usual dictionary representation, except that the point arrays of each
+tune (``independent`` and ``dependent``) are replaced by ``{"$array": [offset, count]}``,
+the byte offset of the block (from the start of the blocks) and its number of points.
+Blocks start on 8 byte boundaries, so they can be memory mapped and used in place.
+"""
+
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"ATTUNEB\x01"
+_ARRAYS = ("independent", "dependent")
+
+
+def is_binary(raw) -> bool:
+    return not isinstance(raw, str) and bytes(raw[: len(MAGIC)]) == MAGIC
+
+
+def _default(obj):
+    # e.g. arrays and numpy scalars in transition metadata
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(d: dict) -> bytes:
+    """Encode the dictionary representation of an instrument (or part of one)."""
+    blocks = []
+    offset = 0
+
+    def split(obj):
+        nonlocal offset
+        if isinstance(obj, dict):
+            out = {}
+            for k, v in obj.items():
+                if k in _ARRAYS and not isinstance(v, dict):
+                    arr = np.ascontiguousarray(v, dtype="<f8")
+                    out[k] = {"$array": [offset, arr.size]}
+                    blocks.append(arr.tobytes())
+                    offset += arr.nbytes
+                else:
+                    out[k] = split(v)
+            return out
+        if isinstance(obj, list):
+            return [split(i) for i in obj]
+        return obj
+
+    header = json.dumps(split(d), default=_default).encode()
+    start = len(MAGIC) + 8 + len(header)
+    header += b" " * (-start % 8)
+    return b"".join([MAGIC, struct.pack("<Q", len(header)), header, *blocks])
+
+
+def loads(raw) -> dict:
+    """Decode a binary container from bytes, arrays are read only views into ``raw``."""
+    (length,) = struct.unpack("<Q", raw[len(MAGIC) : len(MAGIC) + 8])
+    start = len(MAGIC) + 8 + length
+    header = json.loads(bytes(raw[len(MAGIC) + 8 : start]))
+    data = np.frombuffer(raw, dtype=np.uint8, offset=start)
+    return _join(header, data)
+
+
+def load(path) -> dict:
+    """Decode a binary container file, memory mapping its arrays rather than reading them."""
+    with open(path, "rb") as f:
+        prefix = f.read(len(MAGIC) + 8)
+        (length,) = struct.unpack("<Q", prefix[len(MAGIC) :])
+        header = json.loads(f.read(length))
+    start = len(MAGIC) + 8 + length
+    try:
+        data = np.memmap(path, dtype=np.uint8, mode="r", offset=start)
+    except ValueError:
+        data = np.empty(0, dtype=np.uint8)  # no arrays, mmap refuses empty files
+    return _join(header, data.view(np.ndarray))
+
+
+def _join(obj, data):
+    if isinstance(obj, dict):
+        if "$array" in obj:
+            offset, count = obj["$array"]
+            return data[offset : offset + 8 * count].view("<f8")
+        return {k: _join(v, data) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_join(i, data) for i in obj]
+    return obj
@@ -1,7 +1,11 @@
+from datetime import timedelta
+
 import click
 
 from .__version__ import __version__
 from . import _store as store
+from ._compact import compact as _compact
+from . import _gc
 
 
 @click.group()
@@ -39,5 +43,49 @@ def history(instrument, n=10, start="now", forward=False):
     store.print_history(instrument, n, start, reverse=not forward)
 
 
+@main.command(name="recompress", help="rewrite the files in the store with a compression codec")
+@click.option(
+    "--compression",
+    "-c",
+    type=click.Choice(["zlib", "lzma", "none"]),
+    default=None,
+    help="codec to use (default is $ATTUNE_STORE_COMPRESSION, or none)",
+)
+@click.option("--workers", "-w", type=int, default=None, help="number of worker processes")
+def recompress(compression=None, workers=None):
+    before, after = store.recompress(compression, workers=workers)
+    print(f"{before} bytes -> {after} bytes")
+
+
+@main.command(name="compact", help="pack completed months of history into archives")
+@click.argument("instruments", nargs=-1)
+def compact(instruments):
+    for archive in _compact(list(instruments) or None):
+        print(archive)
+
+
+@main.command(name="gc", help="prune the history of instruments by a retention policy")
+@click.argument("instruments", nargs=-1)
+@click.option(
+    "--keep-all", default=30.0, show_default=True, help="days for which all versions are kept"
+)
+@click.option("--keep-daily", default=None, type=float, help="days for which daily heads are kept")
+@click.option(
+    "--keep-monthly", default=None, type=float, help="days for which monthly heads are kept"
+)
+@click.option("--dry-run", "-n", is_flag=True, default=False, help="only report what would go")
+def gc(instruments, keep_all=30.0, keep_daily=None, keep_monthly=None, dry_run=False):
+    policy = _gc.RetentionPolicy(
+        keep_all=timedelta(days=keep_all),
+        keep_daily=None if keep_daily is None else timedelta(days=keep_daily),
+        keep_monthly=None if keep_monthly is None else timedelta(days=keep_monthly),
+    )
+    report = _gc.gc(policy, list(instruments) or None, dry_run=dry_run)
+    print(
+        f"{'would remove' if dry_run else 'removed'} {report.versions} versions"
+        f" and {report.objects} objects, {report.bytes} bytes in {report.inodes} inodes"
+    )
+
+
 if __name__ == "__main__":
     main()
@@ -9,6 +9,8 @@ def save(instrument, fig, image_name, save_directory=None):
     save_directory = pathlib.Path(save_directory)
     with open(save_directory / "instrument.json", "w") as f:
         instrument.save(f)
+    if fig is None:
+        return
     # Should we timestamp the image?
     p = (save_directory / image_name).with_suffix(".png")
     wt.artists.savefig(p, fig=fig)
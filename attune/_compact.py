@@ -0,0 +1,81 @@
+"""Pack completed months of store history into archives."""
+
+__all__ = ["compact"]
+
+from datetime import datetime, timezone
+import os
+import shutil
+import zipfile
+
+from ._store import _store_dir, _month_versions
+
+
+def compact(name=None, *, before=None):
+    """Pack each completed month of history into a single archive file.
+
+    All versions stored in ``name/YYYY/MM/`` are moved into ``name/YYYY/MM.zip``,
+    replacing thousands of small directories by one file.
+    Archived versions are read transparently by :meth:`attune.load`, :meth:`attune.restore`
+    and :class:`attune.WalkHistory`.
+    If an archive already exists for a month, newly found versions are merged into it.
+
+    Parameters
+    ----------
+    name: str or list of str, optional
+        The instrument(s) to compact, by default all instruments in the catalog.
+    before: datetime, optional
+        Only months entirely before this time are compacted.
+        Defaults to the start of the current month (UTC).
+
+    Returns
+    -------
+    list of pathlib.Path
+        The archives which were written.
+    """
+    attune_dir = _store_dir()
+    if name is None:
+        names = [n for n in os.listdir(attune_dir) if not n.startswith(".")]
+    elif isinstance(name, str):
+        names = [name]
+    else:
+        names = list(name)
+    if before is None:
+        before = datetime.now(timezone.utc)
+    written = []
+    for n in names:
+        for monthdir in sorted((attune_dir / n).glob("[0-9]*/[0-9][0-9]")):
+            year, month = int(monthdir.parent.name), int(monthdir.name)
+            if not monthdir.is_dir() or (year, month) >= (before.year, before.month):
+                continue
+            written.append(_compact_month(attune_dir / n, year, month))
+    return written
+
+
+def _compact_month(instrument_dir, year, month):
+    monthdir = instrument_dir / str(year) / f"{month:02}"
+    archive = monthdir.with_suffix(".zip")
+    tmp = monthdir.with_name(f".{archive.name}.tmp")
+    versions = sorted(_month_versions(instrument_dir, year, month), key=lambda v: v.time)
+    # versions whose data is still being written, or whose transaction is in progress,
+    # stay where they are
+    versions = [v for v in versions if v.archived or not {"data.pending", "txn"} & set(v.files())]
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_STORED) as z:
+        done = set()
+        for version in versions:
+            # a version may be in both places if a previous compaction was interrupted
+            if version.name in done:
+                continue
+            done.add(version.name)
+            for filename in sorted(version.files()):
+                arcname = f"{version.name}/{filename}"
+                if version.archived:
+                    z.writestr(arcname, version.read(filename))
+                else:
+                    z.write(version.path / filename, arcname)
+    os.replace(tmp, archive)
+    for version in versions:
+        if not version.archived:
+            shutil.rmtree(version.path)
+    if not any(monthdir.iterdir()):
+        monthdir.rmdir()
+    return archive
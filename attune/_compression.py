@@ -0,0 +1,47 @@
+"""Compression codecs for serialized instruments."""
+
+import lzma
+import os
+import zlib
+from typing import Optional
+
+codecs = {
+    "zlib": (zlib.compress, zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+def resolve(compression: Optional[str]) -> Optional[str]:
+    """Pick the codec to write with, falling back to the ATTUNE_STORE_COMPRESSION variable."""
+    if compression is None:
+        compression = os.environ.get("ATTUNE_STORE_COMPRESSION") or None
+    if compression in (None, "none"):
+        return None
+    if compression not in codecs:
+        raise ValueError(
+            f"Unknown compression '{compression}', expected one of {list(codecs)} or 'none'"
+        )
+    return compression
+
+
+def detect(raw: bytes) -> Optional[str]:
+    """Identify the codec used for raw bytes from their magic number (None if uncompressed)."""
+    if raw[:6] == b"\xfd7zXZ\x00":
+        return "lzma"
+    # zlib streams begin with a deflate header whose 16 bit value is a multiple of 31
+    if len(raw) > 1 and raw[0] & 0x0F == 8 and (raw[0] << 8 | raw[1]) % 31 == 0:
+        return "zlib"
+    return None
+
+
+def compress(raw: bytes, compression: Optional[str]) -> bytes:
+    if compression is None:
+        return raw
+    return codecs[compression][0](raw)
+
+
+def decompress(raw: bytes) -> bytes:
+    codec = detect(raw)
+    if codec is None:
+        return raw
+    return codecs[codec][1](raw)
@@ -68,6 +68,12 @@ class DiscreteTune:
     def __eq__(self, other):
         return self.ranges == other.ranges and self.default == other.default
 
+    def __getstate__(self):
+        return {"ranges": self._ranges, "default": self._default}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
     def as_dict(self):
         """Serialize this Tune as a python dictionary."""
         out = {}
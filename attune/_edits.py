@@ -0,0 +1,71 @@
+__all__ = ["apply_edits"]
+
+import inspect
+
+from ._arrangement import Arrangement
+from ._instrument import Instrument
+from ._map import _map_ind_limits, _map_ind_points
+from ._offset import _offset_by, _offset_to
+from ._transition import Transition
+
+_EDITS = {
+    "offset_by": _offset_by,
+    "offset_to": _offset_to,
+    "map_ind_points": _map_ind_points,
+    "map_ind_limits": _map_ind_limits,
+}
+
+
+def apply_edits(instrument, edits):
+    """Apply several offset and map operations to an instrument in one transition.
+
+    Each edit is a dictionary with the name of the operation as ``"type"``
+    ("offset_by", "offset_to", "map_ind_points" or "map_ind_limits") and the arguments
+    of that function (other than the instrument) as keywords.
+    Edits are applied in order, so an edit sees the result of those before it.
+    Arrangements which are edited are copied once, the others are shared with ``instrument``.
+
+    Parameters
+    ----------
+    instrument: Instrument
+        The instrument object to alter.
+    edits: list of dict
+        The operations to apply, e.g.
+        ``[{"type": "offset_by", "arrangement": "sig", "tune": "c1", "amount": 0.5}]``.
+
+    Returns
+    -------
+    Instrument
+        The instrument with every edit applied, with one "apply_edits" transition whose
+        metadata lists the edits, with all their arguments, as ``"edits"``.
+    """
+    arrangements = dict(instrument._arrangements._items)
+    copied = set()
+    md = []
+    for edit in edits:
+        edit = dict(edit)
+        kind = edit.pop("type", None)
+        if kind not in _EDITS:
+            raise ValueError(f"Unknown edit type '{kind}', expected one of {list(_EDITS)}")
+        arrangement = edit.pop("arrangement")
+        tune = edit.pop("tune")
+        func = _EDITS[kind]
+        try:
+            bound = inspect.signature(func).bind(None, **edit)
+        except TypeError as e:
+            raise TypeError(f"Invalid arguments for {kind} edit: {e}") from None
+        bound.apply_defaults()
+        args = {k: v for k, v in bound.arguments.items() if k != "tune"}
+        if arrangement not in copied:
+            arr = instrument[arrangement]
+            arrangements[arrangement] = Arrangement(arr.name, dict(arr._tunes._items))
+            copied.add(arrangement)
+        tunes = arrangements[arrangement]._tunes
+        tunes[tune] = func(tunes[tune], **args)
+        md.append({"type": kind, "arrangement": arrangement, "tune": tune, **args})
+    return Instrument(
+        arrangements,
+        instrument.setables,
+        name=instrument.name,
+        transition=Transition("apply_edits", instrument, metadata={"edits": md}),
+    )
@@ -0,0 +1,264 @@
+"""Prune store history according to a retention policy."""
+
+__all__ = ["RetentionPolicy", "GCReport", "gc"]
+
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import os
+import shutil
+import zipfile
+
+import dateutil.parser
+
+from ._store import (
+    _store_dir,
+    _objects_dir,
+    _all_versions,
+    _loads,
+    _lock,
+    _merge_record,
+    _read_object,
+)
+
+_STALE = 24 * 60 * 60  # seconds after which unfinished writes are considered abandoned
+
+
+@dataclass
+class RetentionPolicy:
+    """Which versions of an instrument's history to keep.
+
+    Every version younger than ``keep_all`` is kept.
+    Beyond that, only the last version of each (UTC) day is kept, for versions younger than
+    ``keep_daily``, and then only the last version of each month, for versions younger than
+    ``keep_monthly``. Older versions are removed.
+    ``None`` keeps the corresponding tier forever.
+
+    The current head and any version which was the target of a :meth:`attune.restore`
+    are always kept.
+
+    Parameters
+    ----------
+    keep_all: timedelta
+        Age up to which every version is kept. Default is 30 days.
+    keep_daily: timedelta (optional)
+        Age up to which daily heads are kept. Default is None (forever).
+    keep_monthly: timedelta (optional)
+        Age up to which monthly heads are kept. Default is None (forever).
+    """
+
+    keep_all: timedelta = timedelta(days=30)
+    keep_daily: Optional[timedelta] = None
+    keep_monthly: Optional[timedelta] = None
+
+    def select(self, times, now=None):
+        """The subset of the given version times which this policy keeps."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        times = sorted(times)
+        last_of_day = {t.date(): t for t in times}
+        last_of_month = {(t.year, t.month): t for t in times}
+        keep = set()
+        for t in times:
+            age = now - t
+            if age <= self.keep_all:
+                keep.add(t)
+            elif self.keep_daily is None or age <= self.keep_daily:
+                if last_of_day[t.date()] == t:
+                    keep.add(t)
+            elif self.keep_monthly is None or age <= self.keep_monthly:
+                if last_of_month[(t.year, t.month)] == t:
+                    keep.add(t)
+        if times:
+            keep.add(times[-1])
+        return keep
+
+
+@dataclass
+class GCReport:
+    """Summary of a garbage collection of the store.
+
+    Parameters
+    ----------
+    versions: int
+        Number of versions removed.
+    objects: int
+        Number of tune and arrangement objects no longer referenced, and removed.
+    bytes: int
+        Number of bytes reclaimed.
+    inodes: int
+        Number of files and directories removed.
+    """
+
+    versions: int = 0
+    objects: int = 0
+    bytes: int = 0
+    inodes: int = 0
+
+
+def gc(policy=None, name=None, *, dry_run=False):
+    """Remove versions from the store history according to a retention policy.
+
+    Tune and arrangement objects which are no longer referenced by any remaining version
+    (including its ``previous_instrument.json``) are removed as well.
+    The write lock of every instrument is held meanwhile, so the store can be used
+    concurrently, but instruments are not stored until the collection completes.
+
+    Parameters
+    ----------
+    policy: RetentionPolicy, optional
+        Which versions to keep, by default all versions from the last 30 days and daily
+        heads before that.
+    name: str or list of str, optional
+        The instrument(s) to prune, by default all instruments in the catalog.
+        Objects are only removed if unreferenced by every instrument.
+    dry_run: bool, optional
+        If True, report what would be removed without removing anything.
+
+    Returns
+    -------
+    GCReport
+        The number of versions and objects removed, and the bytes and inodes reclaimed.
+    """
+    if policy is None:
+        policy = RetentionPolicy()
+    attune_dir = _store_dir()
+    names = [n for n in os.listdir(attune_dir) if not n.startswith(".")]
+    if name is None:
+        prune = set(names)
+    elif isinstance(name, str):
+        prune = {name}
+    else:
+        prune = set(name)
+    # stores reuse objects which may look unreferenced, they must not run between mark and sweep
+    with contextlib.ExitStack() as stack:
+        for n in sorted(names):
+            stack.enter_context(_lock(n))
+        return _collect(policy, names, prune, dry_run)
+
+
+def _collect(policy, names, prune, dry_run):
+    attune_dir = _store_dir()
+    start = datetime.now().timestamp()
+    report = GCReport()
+    referenced = set()
+    arrangement_refs = {}
+
+    def mark(raw):
+        d = _loads(raw)
+        for arr in d["arrangements"].values():
+            if "$ref" not in arr:
+                continue
+            key = arr["$ref"]
+            referenced.add(key)
+            if key not in arrangement_refs:
+                tunes = _read_object(arr)["tunes"].values()
+                arrangement_refs[key] = {t["$ref"] for t in tunes if "$ref" in t}
+            referenced.update(arrangement_refs[key])
+        for arr in (_merge_record(d) or {}).values():
+            referenced.update(t["$ref"] for t in arr["tunes"].values() if "$ref" in t)
+
+    drops = {}
+    for n in names:
+        versions = []
+        for version in _all_versions(attune_dir / n):
+            if version.committed():
+                versions.append(version)
+            elif version.path.stat().st_mtime < start - _STALE:
+                # part of a transaction which never committed
+                _remove(version, report, drops, dry_run)
+        if n in prune:
+            restored = set()
+            for version in versions:
+                transition = _loads(version.read("instrument.json"))["transition"]
+                if transition["type"] == "restore":
+                    restored.add(dateutil.parser.isoparse(transition["metadata"]["time"]))
+            keep = policy.select([v.time for v in versions]) | restored
+        else:
+            keep = {v.time for v in versions}
+        for tmp in (attune_dir / n).glob(".tmp-*"):
+            # left behind by writers which did not finish
+            if tmp.stat().st_mtime < start - _STALE:
+                _remove_tmp(tmp, report, dry_run)
+        for version in versions:
+            if version.time not in keep and not _data_pending(version, start):
+                _remove(version, report, drops, dry_run)
+                continue
+            for filename in version.files():
+                if filename in ("instrument.json", "previous_instrument.json"):
+                    mark(version.read(filename))
+
+    for path in _objects_dir().glob("*/*"):
+        if path.name.startswith(".tmp-") and path.stat().st_mtime < start - _STALE:
+            _remove_tmp(path, report, dry_run)
+        if path.name in referenced or path.name.startswith("."):
+            continue
+        # objects written (or reused) since the scan began may belong to a version of an
+        # instrument which is new to the store, and so was not locked
+        if path.stat().st_mtime >= start:
+            continue
+        report.objects += 1
+        report.bytes += path.stat().st_size
+        report.inodes += 1
+        if not dry_run:
+            path.unlink()
+    if not dry_run:
+        report.inodes += _rewrite_archives(drops)
+        for pattern in ("*/*/*", "*/*"):
+            for path in attune_dir.glob(pattern):
+                if path.is_dir() and not any(path.iterdir()):
+                    report.inodes += 1
+                    path.rmdir()
+    return report
+
+
+def _data_pending(version, start):
+    if version.archived or "data.pending" not in version.files():
+        return False
+    return (version.path / "data.pending").stat().st_mtime >= start - _STALE
+
+
+def _remove_tmp(path, report, dry_run):
+    files = [path] if path.is_file() else [path, *path.iterdir()]
+    report.bytes += sum(p.stat().st_size for p in files if p.is_file())
+    report.inodes += len(files)
+    if not dry_run:
+        if path.is_file():
+            path.unlink()
+        else:
+            shutil.rmtree(path)
+
+
+def _remove(version, report, drops, dry_run):
+    report.versions += 1
+    if version.archived:
+        report.bytes += sum(i.compress_size for i in version.members.values())
+        drops.setdefault(version.path, set()).add(version.name)
+        return
+    for p in version.path.iterdir():
+        report.bytes += p.stat().st_size
+        report.inodes += 1
+    report.inodes += 1
+    if not dry_run:
+        shutil.rmtree(version.path)
+
+
+def _rewrite_archives(drops):
+    """Rewrite archives without the dropped versions, returning the number of archives removed."""
+    removed = 0
+    for path, drop in drops.items():
+        tmp = path.with_name(f".{path.name}.tmp")
+        kept = 0
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(tmp, "w", zipfile.ZIP_STORED) as z:
+            for info in src.infolist():
+                if info.filename.partition("/")[0] not in drop:
+                    z.writestr(info, src.read(info))
+                    kept += 1
+        if kept:
+            os.replace(tmp, path)
+        else:
+            os.remove(tmp)
+            os.remove(path)
+            removed += 1
+    return removed
@@ -0,0 +1,128 @@
+"""Evaluate tunes across the stored history of an instrument."""
+
+__all__ = ["history_matrix"]
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.interpolate
+
+from ._store import (
+    _store_dir,
+    _loads,
+    _month_versions,
+    _parse_time,
+    _read_object,
+    _version_months,
+)
+
+
+def history_matrix(name, arrangement, tune, setpoints, start=None, stop=None, *, workers=None):
+    """Evaluate one tune at fixed setpoints for every stored version of an instrument.
+
+    Only the requested tune is read from each version, no Instrument objects are built.
+    Tunes shared by several versions are evaluated once.
+    The result matches calling each instrument of :class:`attune.WalkHistory`, i.e.
+    ``instr[arrangement][tune](setpoints)``, including linear extrapolation.
+
+    Parameters
+    ----------
+    name: str
+        The key of the instrument.
+    arrangement: str
+        The arrangement containing the tune.
+    tune: str
+        The tune to evaluate.
+    setpoints: 1D array-like
+        Independent values at which to evaluate the tune, in the tune's independent units.
+    start: str, datetime, optional
+        Earliest version to include, see :meth:`attune.load`. Default is the first version.
+    stop: str, datetime, optional
+        Latest version to include, see :meth:`attune.load`. Default is now.
+    workers: int, optional
+        Number of threads used to read versions.
+
+    Returns
+    -------
+    times: numpy.ndarray
+        The (UTC) times at which each version was stored, as datetime64[ms], in order.
+    values: numpy.ndarray
+        Array of shape (versions, setpoints). Rows are NaN for versions which do not contain
+        the tune.
+
+    Raises
+    ------
+    TypeError
+        If the tune is a DiscreteTune, which can not be evaluated at setpoints.
+    """
+    memo = {}
+    start = None if start is None else _parse_time(start, memo)
+    stop = _parse_time(stop, memo)
+    setpoints = np.asarray(setpoints, dtype=float)
+    instrument_dir = _store_dir() / name
+    if not instrument_dir.exists():
+        raise ValueError(f"No instrument found with name '{name}'")
+
+    versions = []
+    for year, month in _version_months(instrument_dir):
+        if (year, month) > (stop.year, stop.month):
+            break
+        if start is not None and (year, month) < (start.year, start.month):
+            continue
+        for version in _month_versions(instrument_dir, year, month):
+            if start is not None and version.time < start or version.time > stop:
+                continue
+            versions.append(version)
+    versions.sort(key=lambda v: v.time)
+
+    cache = {}
+    missing = np.full(setpoints.shape, np.nan)
+
+    def evaluate(d):
+        if "independent" not in d:
+            raise TypeError(
+                f"Tune '{tune}' of arrangement '{arrangement}' is discrete, "
+                "only continuous tunes can be evaluated"
+            )
+        ind, dep = np.asarray(d["independent"], float), np.asarray(d["dependent"], float)
+        return scipy.interpolate.interp1d(ind, dep, fill_value="extrapolate")(setpoints)
+
+    def cached(ref, compute):
+        # objects are content addressed: equal keys always give equal results
+        key = ref["$ref"]
+        if key not in cache:
+            cache[key] = compute(_read_object(ref))
+        return cache[key]
+
+    def find(version):
+        # the serialized tune (or the reference to it), None if the version does not contain it
+        arrs = _loads(version.read("instrument.json"))["arrangements"]
+        if arrangement not in arrs:
+            return None
+        arr = arrs[arrangement]
+        if "$ref" in arr:
+            tunes = cached(arr, lambda d: d["tunes"])
+        else:
+            tunes = arr["tunes"]  # versions written before deduplication
+        return tunes.get(tune)
+
+    def row(version):
+        if not version.committed():
+            return None
+        d = find(version)
+        if d is None:
+            return missing
+        if "$ref" in d:
+            return cached(d, evaluate)
+        return evaluate(d)
+
+    # a discrete tune is reported before the history is read, if the latest version has it
+    if versions:
+        row(versions[-1])
+
+    with ThreadPoolExecutor(workers) as executor:
+        rows = list(executor.map(row, versions))
+    keep = [i for i, r in enumerate(rows) if r is not None]
+    times = np.array([versions[i].time.replace(tzinfo=None) for i in keep], "datetime64[ms]")
+    values = np.array([rows[i] for i in keep]).reshape(len(keep), setpoints.size)
+    return times, values
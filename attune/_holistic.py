@@ -8,9 +8,8 @@ import scipy
 import WrightTools as wt
 from ._instrument import Instrument
 from ._transition import Transition
-from ._plot import plot_holistic
 from ._common import save
-
+from ._report import RenderReport
 
 __all__ = ["holistic"]
 
@@ -52,6 +51,7 @@ def holistic(
     gtol=0.01,
     autosave=True,
     save_directory=None,
+    plot=True,
     **spline_kwargs,
 ):
     """Workup multi-dependent tuning data.
@@ -90,6 +90,10 @@ def holistic(
         Toggles saving of instrument files and images.
     save_directory: Path-like (Defaults to current working directory)
         Specify where to save files.
+    plot: bool (default True)
+        Toggles drawing the figure.
+        If False, no figure is made or saved, and a RenderReport which draws it on demand
+        is returned along with the instrument.
     **spline_kwargs:
         Extra arguments to pass to spline creation (e.g. s=0, k=1 for linear interpolation)
     """
@@ -163,7 +167,9 @@ def holistic(
 
     new_instrument = _gen_instr(instrument, arrangement, tunes, splines, transition)
 
-    fig, _ = plot_holistic(
+    report = RenderReport(
+        "holistic",
+        "plot_holistic",
         data,
         amplitudes.natural_name,
         centers.natural_name,
@@ -173,6 +179,11 @@ def holistic(
         instrument,
         out_points,
     )
+    if not plot:
+        if autosave:
+            save(new_instrument, None, "holistic", save_directory)
+        return new_instrument, report
+    fig = report.render()
 
     if autosave:
         save(new_instrument, fig, "holistic", save_directory)
@@ -5,12 +5,18 @@ from datetime import datetime as _datetime
 from typing import Dict, Optional, Union
 import json
 
+from . import _binary, _schema
 from ._arrangement import Arrangement
+from ._lazy import LazyDict
 from ._setable import Setable
 from ._note import Note
 from ._transition import Transition, TransitionType
 
 
+def _mkarrangement(dict_):
+    return Arrangement(**dict_)
+
+
 class Instrument(object):
     def __init__(
         self,
@@ -42,9 +48,8 @@ class Instrument(object):
             Ignore for instruments not retrieved from the store.
         """
         self._name: Optional[str] = name
-        self._arrangements: Dict["str", Arrangement] = {
-            k: Arrangement(**v) if isinstance(v, dict) else v for k, v in arrangements.items()
-        }
+        # serialized arrangements are built when first accessed
+        self._arrangements: Dict["str", Arrangement] = LazyDict(arrangements, _mkarrangement)
         if setables is None:
             setables = {}
         self._setables: Dict["str", Setable] = {
@@ -75,10 +80,28 @@ class Instrument(object):
             return False
         return True
 
+    def __getstate__(self):
+        # arrangements which were never used are sent in their serialized form
+        return {
+            "arrangements": dict(self._arrangements._items),
+            "setables": self._setables,
+            "name": self._name,
+            "transition": self._transition,
+            "load": self._load,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
     def __call__(self, ind_value, arrangement_name=None) -> Note:
         # get correct arrangement
         valid = []
-        for arrangement in self._arrangements.values():
+        if arrangement_name in self._arrangements:
+            # only the requested arrangement needs to be built and checked
+            candidates = [self._arrangements[arrangement_name]]
+        else:
+            candidates = self._arrangements.values()
+        for arrangement in candidates:
             # we should probably do "close enough" for floating point on the edges...
             try:
                 if arrangement.ind_min <= ind_value <= arrangement.ind_max:
@@ -177,15 +200,35 @@ class Instrument(object):
     @property
     def arrangements(self):
         """The arrangements associated with this instrument."""
-        return self._arrangements
+        # building every arrangement, but not their tunes
+        return self._arrangements.built()
 
     @property
     def load(self):
         """The POSIX timestamp for when this instrument was created, if it was stored."""
         return self._load
 
-    def save(self, file):
-        """Save the JSON representation into an open file."""
+    def save(self, file, *, format="json"):
+        """Save the JSON representation into an open file.
+
+        Parameters
+        ----------
+        file: FileLike
+            The file to write to, opened in text mode for "json" or binary mode for "binary".
+        format: str, optional
+            "json" (default), "json-base64", JSON in which numeric arrays are written
+            as base64 encoded buffers (schema version 2), which is smaller and faster to
+            parse, or "binary", a JSON header followed by the tune points as contiguous
+            little-endian float64 blocks, which :meth:`attune.open` memory maps rather
+            than parses.
+        """
+        if format == "binary":
+            file.write(_binary.dumps(self.as_dict()))
+            return
+        if format not in ("json", "json-base64"):
+            raise ValueError(
+                f"Unknown format '{format}', expected 'json', 'json-base64' or 'binary'"
+            )
 
         class NdarrayEncoder(json.JSONEncoder):
             def default(self, obj):
@@ -193,4 +236,10 @@ class Instrument(object):
                     return obj.tolist()
                 return json.JSONEncoder.default(self, obj)
 
-        json.dump(self.as_dict(), file, cls=NdarrayEncoder)
+        if format == "json-base64":
+            # arrays are encoded by the schema, numpy scalars still need the fallback
+            d = {"schema": _schema.SCHEMA, **_schema.encode(self.as_dict())}
+            file.write(json.dumps(d, cls=NdarrayEncoder))
+            return
+        # dumps encodes in one call to the C encoder, dump would stream through the Python one
+        file.write(json.dumps(self.as_dict(), cls=NdarrayEncoder))
@@ -8,9 +8,8 @@ from ._arrangement import Arrangement
 from ._setable import Setable
 from ._tune import Tune
 from ._transition import Transition
-from ._plot import plot_intensity
 from ._common import save
-
+from ._report import RenderReport
 
 # --- processing methods --------------------------------------------------------------------------
 
@@ -44,6 +43,7 @@ def intensity(
     ltol=0.1,
     autosave=True,
     save_directory=None,
+    plot=True,
     **spline_kwargs,
 ):
     """Workup a generic intensity plot for a single dependent.
@@ -70,6 +70,10 @@ def intensity(
         toggles saving of instrument file and images (Defaults to True)
     save_directory: Path-like
         where to save (Defaults to current working directory)
+    plot: bool, optional
+        toggles drawing the figure (Defaults to True).
+        If False, no figure is made or saved, and a RenderReport which draws it on
+        demand is returned along with the instrument.
     **spline_kwargs: optional
         extra arguments to pass to spline creation (e.g. s=0, k=1 for linear interpolation)
 
@@ -77,6 +81,8 @@ def intensity(
     -------
     attune.Instrument
         New instrument object.
+    attune.RenderReport
+        Only with ``plot=False``, draws the figure of the workup on demand.
     """
     metadata = {
         "channel": channel,
@@ -99,7 +105,7 @@ def intensity(
         old_instrument = None
         setpoints = data.axes[0].points
     # TODO: units
-    setpoints.sort()
+    setpoints = np.sort(setpoints)
 
     if isinstance(channel, (int, str)):
         channel = data.channels[wt.kit.get_index(data.channel_names, channel)]
@@ -151,9 +157,22 @@ def intensity(
             {arrangement: arr}, {tune: Setable(tune)}, transition=transition
         )
 
-    fig, _ = plot_intensity(
-        data, channel.natural_name, arrangement, tune, new_instrument, instrument, raw_offsets
+    report = RenderReport(
+        "intensity",
+        "plot_intensity",
+        data,
+        channel.natural_name,
+        arrangement,
+        tune,
+        new_instrument,
+        instrument,
+        raw_offsets,
     )
+    if not plot:
+        if autosave:
+            save(new_instrument, None, "intensity", save_directory)
+        return new_instrument, report
+    fig = report.render()
 
     if autosave:
         save(new_instrument, fig, "intensity", save_directory)
@@ -0,0 +1,81 @@
+"""Sharing of identical tunes between arrangements and instruments."""
+
+__all__ = ["memory_report"]
+
+import hashlib
+import threading
+import weakref
+
+from ._discrete_tune import DiscreteTune
+from ._tune import Tune
+
+# tunes are immutable, equal tunes which are alive anywhere in the process are shared
+_interned = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+
+def _key(tune):
+    if isinstance(tune, DiscreteTune):
+        return repr((tune.ind_units, tuple(tune.ranges.items()), tune.default))
+    h = hashlib.sha256(repr((tune.ind_units, tune.dep_units, len(tune))).encode())
+    h.update(tune.independent.tobytes())
+    h.update(tune.dependent.tobytes())
+    return h.digest()
+
+
+def _intern(tune):
+    """The tune equal to ``tune`` which is already in use, or ``tune`` itself if there is none."""
+    key = _key(tune)
+    with _lock:
+        existing = _interned.get(key)
+        if existing is None:
+            _interned[key] = tune
+            return tune
+    return existing
+
+
+def memory_report(*instruments) -> dict:
+    """Report the memory held by the tunes of instruments, counting shared tunes once.
+
+    Tunes of instruments opened, loaded or read from TOPAS files are interned:
+    identical Tunes and DiscreteTunes are the same object, within an instrument and across
+    instruments, so their points and interpolators are held once.
+
+    Parameters
+    ----------
+    instruments: attune.Instrument
+        The instruments to report on. All of their tunes are built.
+
+    Returns
+    -------
+    dict
+        ``tunes``, the number of tunes in all arrangements, ``unique_tunes``, the number of
+        distinct tune objects among them, ``interpolators``, the number of those which
+        built an interpolator, ``nbytes``, the size of the tune points if every tune held
+        its own copy, ``shared_nbytes``, their size counting each distinct array once,
+        and ``saved_nbytes``, the difference.
+    """
+    tunes = [
+        tune
+        for instrument in instruments
+        for arrangement in instrument.arrangements.values()
+        for tune in arrangement.tunes.values()
+    ]
+    unique = {id(tune): tune for tune in tunes}
+    arrays = {}
+    nbytes = 0
+    for tune in tunes:
+        if isinstance(tune, Tune):
+            for arr in (tune.independent, tune.dependent):
+                nbytes += arr.nbytes
+                arrays[id(arr)] = arr.nbytes
+    out = {}
+    out["tunes"] = len(tunes)
+    out["unique_tunes"] = len(unique)
+    out["interpolators"] = sum(
+        getattr(t, "_interpolator", None) is not None for t in unique.values()
+    )
+    out["nbytes"] = nbytes
+    out["shared_nbytes"] = sum(arrays.values())
+    out["saved_nbytes"] = out["nbytes"] - out["shared_nbytes"]
+    return out
@@ -0,0 +1,47 @@
+"""Mapping which builds its values from their serialized form on first access."""
+
+from collections.abc import MutableMapping
+
+
+class LazyDict(MutableMapping):
+    def __init__(self, items, factory):
+        """A dict whose dictionary values are passed through ``factory`` when first accessed.
+
+        Instruments opened or loaded from the store keep the parsed JSON of their
+        arrangements and tunes until they are used, so that e.g. evaluating a single
+        arrangement does not build every Tune of the instrument.
+        ``factory`` must be a module level function, so that the mapping can be pickled.
+        """
+        self._items = dict(items)
+        self._factory = factory
+
+    def built(self) -> dict:
+        """Build every value, returning the underlying dict, which the mapping keeps using.
+
+        The public ``arrangements`` and ``tunes`` properties return this dict, so that they
+        remain ordinary (mutable) dicts of built values.
+        """
+        for key in self._items:
+            self[key]
+        return self._items
+
+    def __getitem__(self, key):
+        value = self._items[key]
+        if isinstance(value, dict):
+            value = self._items[key] = self._factory(value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._items[key] = value
+
+    def __delitem__(self, key):
+        del self._items[key]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
@@ -32,12 +32,8 @@ def map_ind_points(instrument, arrangement, tune, setpoints, units=None):
     """
     md = {"arrangement": arrangement, "tune": tune, "setpoints": setpoints, "units": units}
     to_replace = instrument[arrangement][tune]
-    if units is not None:
-        setpoints = wt.units.convert(setpoints, units, to_replace.ind_units)
     instr = copy.deepcopy(instrument)
-    instr[arrangement]._tunes[tune] = Tune(
-        setpoints, to_replace(setpoints), dep_units=to_replace.dep_units
-    )
+    instr[arrangement]._tunes[tune] = _map_ind_points(to_replace, setpoints, units)
     instr._transition = Transition("map_ind_points", instrument, metadata=md)
     instr._load = None
     return instr
@@ -71,8 +67,19 @@ def map_ind_limits(instrument, arrangement, tune, min, max, units=None):
         The instrument with the tune remapped to new setpoints.
     """
     to_replace = instrument[arrangement][tune]
-    points = np.linspace(min, max, len(to_replace))
-    instr = map_ind_points(instrument, arrangement, tune, points, units)
+    instr = copy.deepcopy(instrument)
+    instr[arrangement]._tunes[tune] = _map_ind_limits(to_replace, min, max, units)
     md = {"arrangement": arrangement, "tune": tune, "min": min, "max": max, "units": units}
     instr._transition = Transition("map_ind_limits", instrument, metadata=md)
+    instr._load = None
     return instr
+
+
+def _map_ind_points(tune, setpoints, units=None):
+    if units is not None:
+        setpoints = wt.units.convert(setpoints, units, tune.ind_units)
+    return Tune(setpoints, tune(setpoints), dep_units=tune.dep_units)
+
+
+def _map_ind_limits(tune, min, max, units=None):
+    return _map_ind_points(tune, np.linspace(min, max, len(tune)), units)
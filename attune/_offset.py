@@ -14,14 +14,8 @@ def offset_by(instrument, arrangement, tune, amount, amount_units=None):
         "amount_units": amount_units,
     }
     to_offset = instrument[arrangement][tune]
-    if amount_units is not None:
-        amount = wt.units.convert(amount, amount_units, to_offset.dep_units)
     instr = copy.deepcopy(instrument)
-    instr[arrangement]._tunes[tune] = Tune(
-        to_offset.independent,
-        to_offset.dependent + amount,
-        dep_units=to_offset.dep_units,
-    )
+    instr[arrangement]._tunes[tune] = _offset_by(to_offset, amount, amount_units)
     instr._transition = Transition("offset_by", instrument, metadata=md)
     instr._load = None
     return instr
@@ -37,9 +31,10 @@ def offset_to(
     setpoint_units=None,
 ):
     to_offset = instrument[arrangement][tune]
-    current = to_offset(setpoint, ind_units=setpoint_units, dep_units=destination_units)
-    offset = destination - current
-    instr = offset_by(instrument, arrangement, tune, offset)
+    instr = copy.deepcopy(instrument)
+    instr[arrangement]._tunes[tune] = _offset_to(
+        to_offset, destination, setpoint, destination_units, setpoint_units
+    )
     md = {
         "arrangement": arrangement,
         "tune": tune,
@@ -49,4 +44,16 @@ def offset_to(
         "setpoint_units": setpoint_units,
     }
     instr._transition = Transition("offset_to", instrument, metadata=md)
+    instr._load = None
     return instr
+
+
+def _offset_by(tune, amount, amount_units=None):
+    if amount_units is not None:
+        amount = wt.units.convert(amount, amount_units, tune.dep_units)
+    return Tune(tune.independent, tune.dependent + amount, dep_units=tune.dep_units)
+
+
+def _offset_to(tune, destination, setpoint, destination_units=None, setpoint_units=None):
+    current = tune(setpoint, ind_units=setpoint_units, dep_units=destination_units)
+    return _offset_by(tune, destination - current)
@@ -1,20 +1,30 @@
-__all__ = ["open"]
+__all__ = ["open", "open_many"]
 
-import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pathlib
 
+from . import _binary, _schema
+from ._compression import decompress
 from ._instrument import Instrument
 
 open_ = open
 
 
 def open(path, *, load=False):
-    """Open an instrument stored in a JSON file.
+    """Open an instrument stored in a JSON (or binary) file.
 
     Parameters
     ----------
 
     path: PathLike or FileLike
-        The path to a file which contains an instrument
+        The path to a file which contains an instrument.
+        Files compressed with zlib or lzma (as written by the store) are detected
+        and decompressed automatically.
+        Files in the "json-base64" and binary formats (see :meth:`attune.Instrument.save`)
+        are detected as well,
+        if given as a path to an uncompressed file, the tune points are memory mapped.
+        Instrument files inside an attune store (which refer to the tunes and arrangements
+        the store shares between versions) are resolved against that store.
     load: datetime
         Allows this method to be used for loading by providing its associated store time
         Should generally be avoided when used directly
@@ -24,10 +34,95 @@ def open(path, *, load=False):
     Instrument
         The instrument that was stored in the file
     """
+    d = _read(path)
+    if any("$ref" in arr for arr in d.get("arrangements", {}).values()):
+        d = _resolve_refs(d, path)
+    return Instrument(**d, load=load)
+
+
+def _read(path):
     if hasattr(path, "read"):
-        d = json.load(path)
+        raw = path.read()
     else:
-        with open_(path, "r") as f:
-            d = json.load(f)
+        with open_(path, "rb") as f:
+            if _binary.is_binary(f.read(len(_binary.MAGIC))):
+                return _binary.load(path)
+            f.seek(0)
+            raw = f.read()
+    if isinstance(raw, bytes):
+        raw = decompress(raw)
+    if _binary.is_binary(raw):
+        return _binary.loads(raw)
+    return _schema.loads(raw)
 
-    return Instrument(**d, load=load)
+
+def _resolve_refs(d, path):
+    # instrument files of the store refer to the tune and arrangement objects shared by versions
+    from ._store import _resolve
+
+    if not hasattr(path, "read"):
+        for parent in pathlib.Path(path).resolve().parents:
+            if (parent / ".objects").is_dir():
+                return _resolve(d, parent / ".objects")
+    raise ValueError(
+        "The instrument refers to the objects of an attune store, which were not found "
+        "alongside the file. Use attune.load to read stored instruments."
+    )
+
+
+def _open_chunk(paths):
+    out = []
+    for path in paths:
+        try:
+            out.append(open(path))
+        except Exception as e:
+            out.append(e)
+    return out
+
+
+def open_many(paths, *, workers=None, ordered=True, chunksize=16):
+    """Open many instrument files in parallel.
+
+    Files are parsed by a pool of worker processes, errors are reported per file rather
+    than aborting the whole batch.
+
+    Parameters
+    ----------
+    paths: iterable of PathLike
+        The paths of the files to open, see :meth:`attune.open`.
+    workers: int, optional
+        Number of worker processes, by default the number of processors.
+    ordered: bool, optional
+        If True (default), results are yielded in the order of ``paths``,
+        otherwise as soon as they are ready.
+    chunksize: int, optional
+        Number of files sent to a worker at once. Default is 16.
+
+    Yields
+    ------
+    tuple
+        ``(path, result)``, where result is the Instrument, or the exception raised
+        while opening the file.
+
+    Examples
+    --------
+    >>> for path, instr in attune.open_many(paths):
+    ...     if isinstance(instr, Exception):
+    ...         print(f"{path}: {instr}")
+    """
+    paths = list(paths)
+    chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+    executor = ProcessPoolExecutor(workers)
+    try:
+        futures = {executor.submit(_open_chunk, chunk): chunk for chunk in chunks}
+        for future in futures if ordered else as_completed(futures):
+            chunk = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                # e.g. a worker died, or an error could not be sent back
+                results = [e] * len(chunk)
+            yield from zip(chunk, results)
+    finally:
+        # a consumer which stops early does not wait for the remaining files
+        executor.shutdown(cancel_futures=True)
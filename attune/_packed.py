@@ -0,0 +1,187 @@
+"""Instruments packed into a single contiguous buffer of tune points."""
+
+__all__ = ["PackedInstrument", "pack"]
+
+import dateutil.parser
+import numpy as np
+
+from ._arrangement import Arrangement, mktune
+from ._instrument import Instrument
+from ._lazy import LazyDict
+from ._note import Note
+from ._tune import Tune
+
+
+def _mkview(dict_):
+    # tunes over the buffer are not interned, which could replace them by copies
+    if "ranges" in dict_:
+        return mktune(dict_)
+    return Tune(**dict_)
+
+
+class PackedInstrument:
+    def __init__(self, buffer, offsets, lengths, header):
+        """An Instrument whose tune points are held in one contiguous float64 buffer.
+
+        Tune ``i`` occupies ``buffer[offsets[i] : offsets[i] + lengths[i]]`` with its
+        independent points, followed by as many dependent points.
+        Made by :meth:`attune.pack`, :meth:`unpack` returns an Instrument whose Tunes
+        are (read only) views into the buffer, so that the points are neither copied nor
+        scattered over many small arrays.
+
+        Parameters
+        ----------
+        buffer: 1D array-like of float64
+            The points of every tune, e.g. an array backed by shared memory.
+        offsets: 1D array-like of int
+            Index into ``buffer`` of the first point of each tune.
+        lengths: 1D array-like of int
+            Number of points of each tune.
+        header: dict
+            Dictionary representation of the instrument (see
+            :meth:`attune.Instrument.as_dict`) in which each Tune is replaced by
+            ``{"$tune": i, "dep_units": units}``, ``i`` being its row in the tables,
+            and ``load`` is an ISO 8601 string (or None).
+        """
+        self._buffer = np.asarray(buffer, dtype=float).view()
+        self._buffer.flags.writeable = False
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._lengths = np.asarray(lengths, dtype=np.int64)
+        self._header = header
+        self._instrument = None
+
+    def __repr__(self):
+        return (
+            f"<PackedInstrument {repr(self.name)}: {self._offsets.size} tunes, "
+            f"{self.nbytes} bytes>"
+        )
+
+    def __getstate__(self):
+        # the unpacked instrument is made again on demand
+        return {
+            "buffer": self._buffer,
+            "offsets": self._offsets,
+            "lengths": self._lengths,
+            "header": self._header,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __call__(self, ind_value, arrangement_name=None) -> Note:
+        return self.instrument(ind_value, arrangement_name)
+
+    @property
+    def name(self):
+        """The name of the instrument."""
+        return self._header.get("name")
+
+    @property
+    def buffer(self):
+        """The points of every tune (read only)."""
+        return self._buffer
+
+    @property
+    def offsets(self):
+        """Index into the buffer of the first point of each tune."""
+        return self._offsets
+
+    @property
+    def lengths(self):
+        """Number of points of each tune."""
+        return self._lengths
+
+    @property
+    def header(self):
+        """Dictionary representation of the instrument, without the tune points."""
+        return self._header
+
+    @property
+    def nbytes(self):
+        """Size of the buffer in bytes."""
+        return self._buffer.nbytes
+
+    @property
+    def instrument(self):
+        """The unpacked instrument, made on first access and kept for evaluation."""
+        if self._instrument is None:
+            self._instrument = self.unpack()
+        return self._instrument
+
+    def points(self, index):
+        """The independent and dependent points of tune ``index``, as views into the buffer."""
+        start = self._offsets[index]
+        length = self._lengths[index]
+        return (
+            self._buffer[start : start + length],
+            self._buffer[start + length : start + 2 * length],
+        )
+
+    def unpack(self) -> Instrument:
+        """Make an Instrument whose Tunes are views into the buffer.
+
+        Arrangements and tunes are built on first access, as for instruments opened from
+        a file.
+        """
+        d = dict(self._header)
+        if d.get("load") is not None:
+            d["load"] = dateutil.parser.isoparse(d["load"])
+        d["arrangements"] = {
+            name: self._arrangement(arr) for name, arr in self._header["arrangements"].items()
+        }
+        return Instrument(**d)
+
+    def _arrangement(self, d):
+        arrangement = Arrangement(d["name"], {})
+        tunes = {k: self._tune(v) for k, v in d["tunes"].items()}
+        arrangement._tunes = LazyDict(tunes, _mkview)
+        return arrangement
+
+    def _tune(self, d):
+        if "$tune" not in d:
+            return d
+        independent, dependent = self.points(d["$tune"])
+        return {"independent": independent, "dependent": dependent, "dep_units": d["dep_units"]}
+
+
+def pack(instrument) -> PackedInstrument:
+    """Pack the tune points of an instrument into a single contiguous buffer.
+
+    Parameters
+    ----------
+    instrument: attune.Instrument
+        The instrument to pack.
+        The previous instrument of its transition is not included, as when it is saved.
+
+    Returns
+    -------
+    PackedInstrument
+        The packed instrument, :meth:`attune.PackedInstrument.unpack` returns an
+        equal Instrument.
+    """
+    tunes = []
+    header = {
+        "name": instrument.name,
+        "arrangements": {},
+        "setables": {k: v.as_dict() for k, v in instrument.setables.items()},
+        "transition": instrument.transition.as_dict(),
+        # the header is kept JSON serializable, e.g. to be published in shared memory
+        "load": None if instrument.load is None else instrument.load.isoformat(),
+    }
+    for name, arr in instrument.arrangements.items():
+        header["arrangements"][name] = {"name": arr.name, "tunes": {}}
+        for tune_name, tune in arr.tunes.items():
+            if isinstance(tune, Tune):
+                d = {"$tune": len(tunes), "dep_units": tune.dep_units}
+                tunes.append(tune)
+            else:
+                d = tune.as_dict()
+            header["arrangements"][name]["tunes"][tune_name] = d
+    lengths = np.array([len(tune) for tune in tunes], dtype=np.int64)
+    offsets = np.zeros(lengths.size, dtype=np.int64)
+    np.cumsum(2 * lengths[:-1], out=offsets[1:])
+    buffer = np.empty(2 * lengths.sum(), dtype=float)
+    for tune, start, length in zip(tunes, offsets, lengths):
+        buffer[start : start + length] = tune.independent
+        buffer[start + length : start + 2 * length] = tune.dependent
+    return PackedInstrument(buffer, offsets, lengths, header)
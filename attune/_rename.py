@@ -9,7 +9,7 @@ def rename(instr: Instrument, name: str):
 
     Note: this tranistion breaks the history, as the primary key changes.
     """
-    trans = Transition(TransitionType.rename, metadata={"old_name": instr.name})
+    trans = Transition(TransitionType.rename, metadata={"old_name": instr.name, "name": name})
     new_instr = instr.as_dict()
     new_instr["transition"] = trans
     new_instr["name"] = name
@@ -0,0 +1,87 @@
+__all__ = ["replay"]
+
+from ._edits import _EDITS, apply_edits
+from ._instrument import Instrument
+from ._rename import rename
+from ._transition import Transition, TransitionType
+from ._update_merge import update_merge
+
+
+def _replay_edit(instrument, type, metadata):
+    # single operations are replayed as one edit, which copies only the edited arrangement
+    out = apply_edits(instrument, [{"type": type, **metadata}])
+    out._transition = Transition(type, instrument, metadata=metadata)
+    return out
+
+
+def _replay_restore(instrument, type, metadata):
+    from ._store import load
+
+    out = load(instrument.name, metadata["time"])
+    out._transition = Transition(TransitionType.restore, metadata=metadata)
+    out._load = None
+    return out
+
+
+def _replay_update_merge(instrument, type, metadata):
+    return update_merge(instrument, Instrument(**metadata["replace"]))
+
+
+def replay(instrument, transitions):
+    """Rebuild an instrument by applying recorded transitions to it again.
+
+    Transitions whose metadata fully determine their result can be replayed:
+    offset_by, offset_to, map_ind_points, map_ind_limits, apply_edits, rename, restore
+    (which loads the restored version from the store) and update_merge.
+    Transitions based on measured data, such as setpoint or holistic, can not.
+
+    Parameters
+    ----------
+    instrument: Instrument
+        The instrument to start from.
+    transitions: iterable of Transition or dict
+        The transitions to apply in order, e.g. those of instruments loaded from the store,
+        or their dictionary representations (see :meth:`attune.Transition.as_dict`).
+
+    Returns
+    -------
+    Instrument
+        The instrument after the last transition, each step is recorded as its transition
+        with the instrument before it as previous.
+
+    Raises
+    ------
+    ValueError
+        If a transition can not be replayed, or was recorded without the metadata needed,
+        as rename and update_merge transitions made by earlier versions of attune.
+    """
+    for transition in transitions:
+        if isinstance(transition, dict):
+            transition = Transition(**transition)
+        type = transition.type
+        if isinstance(type, TransitionType):
+            type = type.value
+        metadata = transition.metadata
+        if type not in _REPLAY:
+            raise ValueError(f"Transitions of type '{type}' can not be replayed")
+        missing = [k for k in _REQUIRED.get(type, ()) if k not in metadata]
+        if missing:
+            raise ValueError(f"The {type} transition does not record {missing}")
+        instrument = _REPLAY[type](instrument, type, metadata)
+    return instrument
+
+
+_REPLAY = {
+    **{type: _replay_edit for type in _EDITS},
+    "apply_edits": lambda instrument, type, md: apply_edits(instrument, md["edits"]),
+    "rename": lambda instrument, type, md: rename(instrument, md["name"]),
+    "restore": _replay_restore,
+    "update_merge": _replay_update_merge,
+}
+# metadata which transitions made by earlier versions of attune may lack
+_REQUIRED = {
+    "apply_edits": ["edits"],
+    "rename": ["name"],
+    "restore": ["time"],
+    "update_merge": ["replace"],
+}
@@ -0,0 +1,70 @@
+"""Figures of workups, drawn only when asked for."""
+
+__all__ = ["RenderReport"]
+
+import pathlib
+
+import WrightTools as wt
+
+
+class RenderReport:
+    def __init__(self, name, plot, *args, **kwargs):
+        """The figure of a workup, which is drawn when rendered rather than by the workup.
+
+        Returned along with the instrument by workups called with ``plot=False``.
+        The plotting module (and the figure) is only made by :meth:`render` or :meth:`save`.
+        The report keeps the (processed copy of the) data of the workup until it is dropped.
+
+        Parameters
+        ----------
+        name: str
+            The name of the image, e.g. "intensity".
+        plot: str
+            The name of the function in ``attune._plot`` which draws the figure.
+        args, kwargs:
+            The arguments of that function.
+        """
+        self._name = name
+        self._plot = plot
+        self._args = args
+        self._kwargs = kwargs
+
+    def __repr__(self):
+        return f"RenderReport({repr(self._name)}, {repr(self._plot)})"
+
+    @property
+    def name(self):
+        """The name of the image."""
+        return self._name
+
+    def render(self):
+        """Draw the figure.
+
+        Returns
+        -------
+        matplotlib.figure.Figure
+            The figure, as the workup would have drawn it with ``plot=True``.
+        """
+        from . import _plot
+
+        fig, _ = getattr(_plot, self._plot)(*self._args, **self._kwargs)
+        return fig
+
+    def save(self, save_directory=None):
+        """Draw the figure, save it as ``<name>.png`` and close it.
+
+        Parameters
+        ----------
+        save_directory: Path-like
+            where to save (Defaults to current working directory)
+
+        Returns
+        -------
+        pathlib.Path
+            The path of the image.
+        """
+        if save_directory is None:
+            save_directory = "."
+        p = (pathlib.Path(save_directory) / self._name).with_suffix(".png")
+        wt.artists.savefig(p, fig=self.render())
+        return p
@@ -0,0 +1,54 @@
+"""Versions of the JSON schema for serialized instruments.
+
+Schema 1 writes every number as decimal text.
+Schema 2 (format "json-base64") writes numeric arrays as typed buffers,
+``{"$base64": <little-endian bytes>, "dtype": "<f8", "shape": [n]}``, and marks
+instrument files with ``"schema": 2``.
+Both are read by :meth:`attune.open` and :meth:`attune.load`.
+"""
+
+import base64
+import json
+
+import numpy as np
+
+SCHEMA = 2
+_ARRAYS = ("independent", "dependent")
+
+
+def encode(obj):
+    """Replace the numeric arrays in a dictionary representation by base64 buffers."""
+    if isinstance(obj, dict):
+        out = {}
+        for k, v in obj.items():
+            if k in _ARRAYS and isinstance(v, list):
+                v = np.asarray(v, dtype=float)
+            out[k] = encode(v)
+        return out
+    if isinstance(obj, (list, tuple)):
+        return [encode(i) for i in obj]
+    if isinstance(obj, np.ndarray) and obj.dtype.kind in "biuf":
+        arr = np.ascontiguousarray(obj, dtype=obj.dtype.newbyteorder("<"))
+        return {
+            "$base64": base64.b64encode(arr.tobytes()).decode(),
+            "dtype": arr.dtype.str,
+            "shape": list(arr.shape),
+        }
+    return obj
+
+
+def _decode(d):
+    if "$base64" in d:
+        buffer = base64.b64decode(d["$base64"])
+        return np.frombuffer(buffer, dtype=d["dtype"]).reshape(d["shape"])
+    return d
+
+
+def loads(text):
+    """Parse JSON of any schema, returning numeric arrays of schema 2 as (read only) arrays."""
+    d = json.loads(text, object_hook=_decode)
+    if isinstance(d, dict):
+        schema = d.pop("schema", 1)
+        if schema > SCHEMA:
+            raise ValueError(f"Unsupported schema {schema}, this attune reads up to {SCHEMA}")
+    return d
@@ -8,9 +8,8 @@ from ._arrangement import Arrangement
 from ._setable import Setable
 from ._tune import Tune
 from ._transition import Transition
-from ._plot import plot_setpoint
 from ._common import save
-
+from ._report import RenderReport
 
 # --- processing methods --------------------------------------------------------------------------
 
@@ -53,6 +52,7 @@ def setpoint(
     instrument=None,
     autosave=True,
     save_directory=None,
+    plot=True,
     **spline_kwargs
 ):
     """Workup a generic setpoint plot for a single tune.
@@ -73,6 +73,10 @@ def setpoint(
         toggles saving of instrument file and images (Defaults to True)
     save_directory: Path-like
         where to save (Defaults to current working directory)
+    plot: bool, optional
+        toggles drawing the figure (Defaults to True).
+        If False, no figure is made or saved, and a RenderReport which draws it on
+        demand is returned along with the instrument.
     **spline_kwargs: optional
         extra arguments to pass to spline creation (e.g. s=0, k=1 for linear interpolation)
 
@@ -80,6 +84,8 @@ def setpoint(
     -------
     attune.Curve
         New instrument object.
+    attune.RenderReport
+        Only with ``plot=False``, draws the figure of the workup on demand.
     """
     metadata = {
         "channel": channel,
@@ -98,7 +104,7 @@ def setpoint(
     else:
         setpoints = data.axes[0].points
     # TODO: units
-    setpoints.sort()
+    setpoints = np.sort(setpoints)
 
     if isinstance(channel, (int, str)):
         channel = data.channels[wt.kit.get_index(data.channel_names, channel)]
@@ -127,9 +133,22 @@ def setpoint(
             {arrangement: arr}, {tune: Setable(tune)}, transition=transition
         )
 
-    fig, _ = plot_setpoint(
-        data, channel.natural_name, arrangement, tune, new_instrument, instrument, raw_offsets
+    report = RenderReport(
+        "setpoint",
+        "plot_setpoint",
+        data,
+        channel.natural_name,
+        arrangement,
+        tune,
+        new_instrument,
+        instrument,
+        raw_offsets,
     )
+    if not plot:
+        if autosave:
+            save(new_instrument, None, "setpoint", save_directory)
+        return new_instrument, report
+    fig = report.render()
 
     if autosave:
         save(new_instrument, fig, "setpoint", save_directory)
@@ -0,0 +1,279 @@
+"""Instruments published in shared memory, for use by several processes."""
+
+__all__ = ["SharedInstrument", "attach", "publish", "unpublish"]
+
+import json
+import os
+import struct
+import sys
+import threading
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from ._note import Note
+from ._packed import PackedInstrument, pack
+from ._store import _dumps
+
+# segments published by this process, by instrument name: (control, data, generation)
+_published = {}
+_lock = threading.Lock()
+
+
+def _control_name(name):
+    return f"attune_{name}"
+
+
+def _data_name(name, generation):
+    return f"attune_{name}_{generation}"
+
+
+def _open_segment(segment_name):
+    """Attach to an existing segment without handing it to the resource tracker.
+
+    Before Python 3.13 attaching registers the segment with the resource tracker,
+    which unlinks it when the attaching process exits, while the publisher still uses it.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(segment_name, track=False)
+    segment = shared_memory.SharedMemory(segment_name)
+    if os.name == "posix":
+        # only POSIX segments are registered
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _generation(control):
+    return struct.unpack_from("<Q", control.buf)[0]
+
+
+def publish(instrument, *, name=None) -> int:
+    """Publish an instrument in shared memory, or replace the one published before.
+
+    The tune points are packed (see :meth:`attune.pack`) into a new shared memory
+    segment, then the generation counter of the name is incremented, which
+    :class:`attune.SharedInstrument` s attached in other processes use to tell that
+    a newer instrument is available.
+    Only one process should publish each name, it keeps the segments until
+    :meth:`attune.unpublish` is called or it exits.
+
+    Parameters
+    ----------
+    instrument: attune.Instrument
+        The instrument to publish.
+    name: str, optional
+        The name to publish under, by default the name of the instrument.
+        Keep names short, some platforms limit shared memory names to 31 characters.
+
+    Returns
+    -------
+    int
+        The generation of the published instrument, 1 for the first.
+    """
+    if name is None:
+        name = instrument.name
+    packed = pack(instrument)
+    # encoded as the store does, transition metadata may hold arrays
+    header = _dumps(
+        {"header": packed.header, "tunes": packed.offsets.size, "points": packed.buffer.size}
+    ).encode()
+    start = 8 + len(header) + (-(8 + len(header)) % 8)
+    size = start + 16 * packed.offsets.size + packed.nbytes
+    with _lock:
+        if name in _published:
+            control, previous, generation = _published[name]
+        else:
+            try:
+                control = shared_memory.SharedMemory(_control_name(name), create=True, size=8)
+                struct.pack_into("<Q", control.buf, 0, 0)
+            except FileExistsError:
+                # left by an earlier publisher of the name, continue its count
+                control = shared_memory.SharedMemory(_control_name(name))
+            previous, generation = None, _generation(control)
+        generation += 1
+        data = shared_memory.SharedMemory(
+            _data_name(name, generation), create=True, size=max(size, 1)
+        )
+        struct.pack_into("<Q", data.buf, 0, len(header))
+        data.buf[8 : 8 + len(header)] = header
+        _Layout(data.buf, start, packed.offsets.size, packed.buffer.size).fill(packed)
+        # readers attach to the new segment from here on
+        struct.pack_into("<Q", control.buf, 0, generation)
+        _published[name] = control, data, generation
+    if previous is not None:
+        # attached processes keep their mapping of the previous generation
+        previous.close()
+        previous.unlink()
+    return generation
+
+
+def unpublish(name):
+    """Remove an instrument published by this process from shared memory.
+
+    Processes which are attached keep their mapping of the last generation.
+
+    Parameters
+    ----------
+    name: str
+        The name the instrument was published under.
+    """
+    with _lock:
+        control, data, _ = _published.pop(name)
+    for segment in (data, control):
+        segment.close()
+        segment.unlink()
+
+
+class _Layout:
+    def __init__(self, buf, start, tunes, points):
+        # frombuffer holds an export of the segment, so it can not be closed under the arrays
+        self.offsets = np.frombuffer(buf, "<i8", tunes, start)
+        self.lengths = np.frombuffer(buf, "<i8", tunes, start + 8 * tunes)
+        self.buffer = np.frombuffer(buf, "<f8", points, start + 16 * tunes)
+
+    def fill(self, packed):
+        self.offsets[:] = packed.offsets
+        self.lengths[:] = packed.lengths
+        self.buffer[:] = packed.buffer
+
+
+class SharedInstrument:
+    def __init__(self, name):
+        """An instrument published in shared memory by another process.
+
+        The tune points are used in place, the Tunes of :attr:`instrument` are read only
+        views into the shared memory.
+        Attaching does not follow later publications,
+        check :attr:`stale` and call :meth:`refresh` to change to the newest generation.
+
+        Parameters
+        ----------
+        name: str
+            The name the instrument was published under, see :meth:`attune.publish`.
+        """
+        self._name = name
+        self._control = _open_segment(_control_name(name))
+        self._data = None
+        self._packed = None
+        self._generation = 0
+        # earlier generations, closed once nothing refers to their points
+        self._retired = []
+        if not self.refresh():
+            self._control.close()
+            raise FileNotFoundError(f"No instrument is published as '{name}'")
+
+    def __repr__(self):
+        return f"<SharedInstrument {repr(self._name)}, generation {self._generation}>"
+
+    def __call__(self, ind_value, arrangement_name=None) -> Note:
+        return self.instrument(ind_value, arrangement_name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def name(self):
+        """The name the instrument was published under."""
+        return self._name
+
+    @property
+    def generation(self):
+        """The generation of the attached instrument."""
+        return self._generation
+
+    @property
+    def published_generation(self):
+        """The generation most recently published."""
+        return _generation(self._control)
+
+    @property
+    def stale(self) -> bool:
+        """Whether a newer generation was published since attaching."""
+        return self.published_generation != self._generation
+
+    @property
+    def packed(self) -> PackedInstrument:
+        """The attached instrument in its packed form."""
+        return self._packed
+
+    @property
+    def instrument(self):
+        """The attached instrument, whose tunes are views into the shared memory."""
+        return self._packed.instrument
+
+    def refresh(self) -> bool:
+        """Attach to the most recently published generation, if it is newer.
+
+        Instruments and tunes taken from the previous generation remain usable,
+        its shared memory is released once they are no longer referenced.
+
+        Returns
+        -------
+        bool
+            True if a newer generation was attached.
+        """
+        while True:
+            generation = self.published_generation
+            if generation == self._generation:
+                return False
+            try:
+                data = _open_segment(_data_name(self._name, generation))
+            except FileNotFoundError:
+                if generation == self.published_generation:
+                    raise
+                continue  # replaced while attaching, try the newest again
+            break
+        (length,) = struct.unpack_from("<Q", data.buf)
+        d = json.loads(bytes(data.buf[8 : 8 + length]))
+        start = 8 + length + (-(8 + length) % 8)
+        layout = _Layout(data.buf, start, d["tunes"], d["points"])
+        if self._data is not None:
+            self._retired.append(self._data)
+        self._data, self._generation = data, generation
+        self._packed = PackedInstrument(layout.buffer, layout.offsets, layout.lengths, d["header"])
+        self._release()
+        return True
+
+    def _release(self):
+        retired = []
+        for segment in self._retired:
+            try:
+                segment.close()
+            except BufferError:
+                retired.append(segment)  # points still in use
+        self._retired = retired
+
+    def close(self):
+        """Detach from the shared memory.
+
+        Instruments and tunes taken from this SharedInstrument must not be used afterwards,
+        BufferError is raised while they are still referenced.
+        """
+        self._packed = None
+        if self._data is not None:
+            self._retired.append(self._data)
+            self._data = None
+        self._release()
+        if self._retired:
+            raise BufferError("Instruments of this SharedInstrument are still in use")
+        self._control.close()
+
+
+def attach(name) -> SharedInstrument:
+    """Attach to an instrument published in shared memory by another process.
+
+    Parameters
+    ----------
+    name: str
+        The name the instrument was published under, see :meth:`attune.publish`.
+
+    Returns
+    -------
+    SharedInstrument
+        The published instrument, which can be called like an Instrument without
+        copying its points.
+    """
+    return SharedInstrument(name)
@@ -0,0 +1,106 @@
+"""Point-in-time views of every instrument in the store."""
+
+__all__ = ["Snapshot", "snapshot"]
+
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+from ._store import _store_dir, _month_versions, _parse_time, _read_instr, _version_months
+
+
+class Snapshot(Mapping):
+    def __init__(self, time, instruments):
+        """The instruments of the store as they were at one moment.
+
+        A read only mapping of instrument names to Instruments, as returned by
+        :meth:`attune.snapshot`.
+        Instruments which did not yet exist at ``time`` are not included.
+
+        Parameters
+        ----------
+        time: datetime
+            The moment of the snapshot (timezone aware).
+        instruments: Dict[str, Instrument]
+            The instrument heads at that moment.
+        """
+        self._time = time
+        self._instruments = dict(sorted(instruments.items()))
+
+    def __repr__(self):
+        return f"Snapshot({self._time.isoformat()}, {list(self._instruments)})"
+
+    def __getitem__(self, name):
+        return self._instruments[name]
+
+    def __iter__(self):
+        return iter(self._instruments)
+
+    def __len__(self):
+        return len(self._instruments)
+
+    @property
+    def time(self):
+        """The moment of the snapshot."""
+        return self._time
+
+    @property
+    def versions(self):
+        """The time each instrument of the snapshot was stored, by name."""
+        return {name: instr.load for name, instr in self._instruments.items()}
+
+    def as_dict(self):
+        """Dictionary representation for this Snapshot, suitable as a provenance record.
+
+        Each instrument is identified by the time its version was stored,
+        ``attune.load(name, time)`` retrieves it again.
+        """
+        out = {}
+        out["time"] = self._time.isoformat()
+        out["versions"] = {name: t.isoformat() for name, t in self.versions.items()}
+        return out
+
+
+def snapshot(time=None, names=None, *, workers=None):
+    """Load every instrument in the store as it was at a single moment.
+
+    Equivalent to calling :meth:`attune.load` with the same time for each instrument in
+    the :meth:`attune.catalog`, but the time is interpreted once, only months which hold
+    versions are searched, and the instruments are loaded in parallel.
+
+    Parameters
+    ----------
+    time: str, datetime, optional
+        The moment of the snapshot, see :meth:`attune.load`.
+        By default uses the current timestamp.
+    names: list of str, optional
+        The instruments to include, by default all instruments in the catalog.
+    workers: int, optional
+        Number of threads used to load instruments.
+
+    Returns
+    -------
+    Snapshot
+        Read only mapping of names to Instruments, with the time of the snapshot.
+    """
+    time = _parse_time(time)
+    attune_dir = _store_dir()
+    if names is None:
+        names = [n for n in os.listdir(attune_dir) if not n.startswith(".")]
+
+    def head(name):
+        instrument_dir = attune_dir / name
+        for year, month in reversed(_version_months(instrument_dir)):
+            if (year, month) > (time.year, time.month):
+                continue
+            versions = sorted(
+                _month_versions(instrument_dir, year, month), key=lambda v: v.time, reverse=True
+            )
+            for version in versions:
+                if version.time <= time and version.committed():
+                    return _read_instr(version, load=version.time)
+        return None
+
+    with ThreadPoolExecutor(workers) as executor:
+        heads = dict(zip(names, executor.map(head, names)))
+    return Snapshot(time, {n: instr for n, instr in heads.items() if instr is not None})
@@ -1,19 +1,49 @@
 """Tools to interact with the attune store."""
 
-__all__ = ["catalog", "load", "restore", "store", "undo", "print_history", "WalkHistory"]
-
-
+__all__ = [
+    "catalog",
+    "load",
+    "restore",
+    "store",
+    "store_transaction",
+    "undo",
+    "print_history",
+    "recompress",
+    "flush_data",
+    "WalkHistory",
+]
+
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+import contextlib
 from datetime import datetime, timedelta, timezone
-from dateparser import parse
+import functools
+import hashlib
+import json
 import pathlib
 import os
+import shutil
+import struct
+import sys
+import threading
+from time import sleep
+import uuid
 import warnings
+import zipfile
 
 import appdirs
-import dateutil
+import dateutil.parser
 
+from . import _binary, _compression, _schema
+from ._instrument import Instrument
 from ._transition import Transition, TransitionType
-from ._open import open as open_
+from ._tune import Tune
+
+
+def _store_dir():
+    if "ATTUNE_STORE" in os.environ and os.environ["ATTUNE_STORE"]:
+        return pathlib.Path(os.environ["ATTUNE_STORE"])
+    return pathlib.Path(appdirs.user_data_dir("attune", "attune"))
 
 
 def catalog(full=False):
@@ -22,11 +52,8 @@ def catalog(full=False):
     By default returns a list of keys available.
     If full is True, loads each instrument as a dictionary of keys to Instrument objects.
     """
-    if "ATTUNE_STORE" in os.environ and os.environ["ATTUNE_STORE"]:
-        attune_dir = pathlib.Path(os.environ["ATTUNE_STORE"])
-    else:
-        attune_dir = pathlib.Path(appdirs.user_data_dir("attune", "attune"))
-    instrument_names = os.listdir(attune_dir)
+    # hidden entries (e.g. the shared object directory) are store internals
+    instrument_names = [n for n in os.listdir(_store_dir()) if not n.startswith(".")]
     if full:
         return {name: load(name) for name in instrument_names}
     else:
@@ -49,77 +76,106 @@ def load(name: str, time=None, reverse: bool = True):
         Direction to search, by default looks for a previous curve.
         If given as False, looks forward in time from the given timestamp.
     """
-    if isinstance(time, str):
-        time = parse(
-            time,
-            settings=dict(
-                TIMEZONE="UTC",
-                PREFER_DATES_FROM="current_period",
-                TO_TIMEZONE="UTC",
-                RETURN_AS_TIMEZONE_AWARE=True,
-            ),
-        )
-        if time is None:
-            raise ValueError("invalid datetime")
-    if time is None:
-        time = datetime.now(timezone.utc)
-    if hasattr(time, "datetime"):
-        time = time.datetime()
-
-    def find(name, time, reverse):
-        year = time.year
-        month = time.month
+    time = _parse_time(time)
+    version = _find_version(_store_dir() / name, time, reverse)
+    return _read_instr(version, load=version.time)
 
-        if "ATTUNE_STORE" in os.environ and os.environ["ATTUNE_STORE"]:
-            attune_dir = pathlib.Path(os.environ["ATTUNE_STORE"])
-        else:
-            attune_dir = pathlib.Path(appdirs.user_data_dir("attune", "attune"))
 
-        if not (attune_dir / name).exists():
-            raise ValueError(f"No instrument found with name '{name}'")
+def _find_version(instrument_dir, time, reverse=True):
+    """The committed version which was the head at ``time`` (or the next one, if not reverse)."""
+    year = time.year
+    month = time.month
 
-        while True:
-            datadir = attune_dir
-            datadir /= name
-            datadir /= str(year)
-            datadir /= f"{month:02}"
-            if datadir.exists():
-                for d in sorted(
-                    datadir.iterdir(),
-                    key=lambda x: dateutil.parser.isoparse(x.name),
-                    reverse=reverse,
-                ):
-                    if reverse:
-                        if dateutil.parser.isoparse(d.name) <= time:
-                            return datadir / d.name
-                    else:
-                        if dateutil.parser.isoparse(d.name) >= time:
-                            return datadir / d.name
+    if not instrument_dir.exists():
+        raise ValueError(f"No instrument found with name '{instrument_dir.name}'")
 
+    while True:
+        for v in sorted(
+            _month_versions(instrument_dir, year, month),
+            key=lambda x: x.time,
+            reverse=reverse,
+        ):
             if reverse:
-                if month == 1:
-                    year -= 1
-                    month = 12
-                else:
-                    month -= 1
-                if year < 1960:
-                    raise ValueError(
-                        f"Could not find an instrument earlier than {time}. Looked back all the way to the invention of the laser"
-                    )
+                if v.time <= time and v.committed():
+                    return v
             else:
-                if month == 12:
-                    month = 1
-                    year += 1
-                else:
-                    month += 1
-                if year > datetime.now().year + 20:
-                    raise ValueError(f"Could not find an instrument later than {time}.")
+                if v.time >= time and v.committed():
+                    return v
 
-    datadir = find(name, time, reverse)
-    return open_(datadir / "instrument.json", load=dateutil.parser.isoparse(datadir.name))
+        if reverse:
+            if month == 1:
+                year -= 1
+                month = 12
+            else:
+                month -= 1
+            if year < 1960:
+                raise ValueError(
+                    f"Could not find an instrument earlier than {time}. Looked back all the way to the invention of the laser"
+                )
+        else:
+            if month == 12:
+                month = 1
+                year += 1
+            else:
+                month += 1
+            if year > datetime.now().year + 20:
+                raise ValueError(f"Could not find an instrument later than {time}.")
+
+
+def _parse_time(time, memo=None):
+    """Interpret a time argument to the store functions as a timezone aware datetime.
+
+    ISO 8601 strings and POSIX timestamps are parsed directly (assuming UTC when no offset is
+    given), dateparser is only imported to interpret natural language such as "5 minutes ago".
+    Strings which are valid ISO 8601 (e.g. "2020" or "20201019") are dates, other strings of
+    digits are only taken as timestamps if they contain a "." or have more than 8 digits.
+    Calls which share a ``memo`` dictionary resolve each natural language string only once,
+    so that a batch of lookups refers to a single instant.
+    """
+    if time is None:
+        return datetime.now(timezone.utc)
+    if hasattr(time, "datetime"):
+        return time.datetime()
+    if isinstance(time, (int, float)):
+        return datetime.fromtimestamp(time, timezone.utc)
+    if not isinstance(time, str):
+        return time
+    text = time.strip()
+    if text.lower() == "now":
+        return datetime.now(timezone.utc)
+    try:
+        parsed = dateutil.parser.isoparse(text)
+    except ValueError:
+        pass
+    else:
+        return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+    # short digit strings such as "202010" are (partial) dates, not seconds since 1970
+    if "." in text or len(text) > 8:
+        try:
+            return datetime.fromtimestamp(float(text), timezone.utc)
+        except (ValueError, OverflowError):
+            pass
+    if memo is not None and text in memo:
+        return memo[text]
+    from dateparser import parse
+
+    parsed = parse(
+        text,
+        settings=dict(
+            TIMEZONE="UTC",
+            PREFER_DATES_FROM="current_period",
+            TO_TIMEZONE="UTC",
+            RETURN_AS_TIMEZONE_AWARE=True,
+        ),
+    )
+    if parsed is None:
+        raise ValueError("invalid datetime")
+    if memo is not None:
+        memo[text] = parsed
+    return parsed
 
 
-def restore(name, time, reverse=True):
+def restore(name, time, reverse=True, *, compression=None, format=None):
     """Restore a previously applied instrument.
 
 
@@ -135,15 +191,34 @@ def restore(name, time, reverse=True):
     reverse: boolean, optional
         Direction to search, by default looks for a previous curve.
         If given as False, looks forward in time from the given timestamp.
+    compression: str, optional
+        Codec used to write the restored version, see :meth:`attune.store`.
+    format: str, optional
+        Encoding of the restored version, see :meth:`attune.store`.
     """
-    instr = load(name, time, reverse)
-    if load(name) == instr:
-        warnings.warn("Attempted to restore instrument equivalent to current head, ignoring.")
-        return
+    compression = _compression.resolve(compression)
+    format = _resolve_format(format)
+    with _lock(name):
+        instr = load(name, time, reverse)
+        if load(name) == instr:
+            warnings.warn("Attempted to restore instrument equivalent to current head, ignoring.")
+            return
+        _store_restore(instr, compression, format=format)
+
+
+def _resolve_format(format):
+    if format is None:
+        format = os.environ.get("ATTUNE_STORE_FORMAT") or "json"
+    if format not in ("json", "json-base64", "binary"):
+        raise ValueError(f"Unknown format '{format}', expected 'json', 'json-base64' or 'binary'")
+    return format
+
+
+def _store_restore(instr, compression=None, **kwargs):
     instr._transition = Transition(
         TransitionType.restore, metadata={"time": instr.load.isoformat()}
     )
-    _store_instr(instr)
+    return _store_instr(instr, compression, **kwargs)
 
 
 class WalkHistory:
@@ -151,7 +226,7 @@ class WalkHistory:
 
     def __init__(self, name, start="now", reverse=True):
         self.name = name
-        self.time = start
+        self.time = _parse_time(start)
         self.reverse = reverse
         self.direction = -1 if reverse else 1
 
@@ -204,7 +279,7 @@ def print_history(name, n=10, start="now", reverse: bool = True):
     print("<end of history>")
 
 
-def store(instrument, warn=True):
+def store(instrument, warn=True, *, compression=None, format=None, defer_data=False):
     """Store an instrument into the catalog.
 
     Parameters
@@ -213,58 +288,701 @@ def store(instrument, warn=True):
         The instrument to store.
     warn: bool
         Whether or not to warn if the store is equivalent to the current head.
+    compression: str, optional
+        Codec used to compress the written files, "zlib", "lzma" or "none".
+        Defaults to the ATTUNE_STORE_COMPRESSION environment variable, if set,
+        otherwise files are not compressed.
+        Compressed files are detected and read transparently.
+    format: str, optional
+        Encoding of the written files, "json", "json-base64" or "binary"
+        (see :meth:`attune.Instrument.save`).
+        "binary" applies to the tune objects, whose points are used in place of the bytes read
+        back rather than parsed.
+        Defaults to the ATTUNE_STORE_FORMAT environment variable, if set, otherwise "json".
+        All formats are detected and read transparently.
+    defer_data: bool
+        If True, the instrument is committed immediately while the data of its
+        transition (``data.wt5``) is written by a background thread.
+        Until written, the version contains a ``data.pending`` marker file.
+        The data object must not be closed before :meth:`attune.flush_data` returns.
+        Default is False: the data is written before the version is committed.
+
+    Within :meth:`attune.store_transaction`, the write is deferred until the transaction
+    commits.
+    """
+    compression = _compression.resolve(compression)
+    format = _resolve_format(format)
+    pending = getattr(_pending_stores, "stores", None)
+    if pending is not None:
+        pending[instrument.name] = (instrument, warn, compression, format, defer_data)
+        return
+    # the lock makes the comparison to the head and the write atomic for concurrent writers
+    with _lock(instrument.name):
+        _store_many([(instrument, warn, compression, format, defer_data)])
+
+
+_pending_stores = threading.local()
+
+
+@contextlib.contextmanager
+def store_transaction():
+    """Store several instruments atomically, with one shared timestamp.
+
+    Calls to :meth:`attune.store` within the context are collected, and written together
+    when it exits: readers see either all of the new heads or none of them, even if the
+    writing process crashes part way.
+    Each new head is stored with the same timestamp, so :meth:`attune.snapshot` and
+    :meth:`attune.load` at any time see a consistent set of instruments.
+    If the context exits with an exception, nothing is stored.
+
+    Instruments stored within the context are not visible to :meth:`attune.load` until it
+    exits. If the same instrument is stored more than once, the last one is committed,
+    along with any transitions applied to it in memory.
+    Contexts may be nested, the outermost commits.
+
+    .. code-block:: python
+
+        with attune.store_transaction():
+            attune.store(opa)
+            attune.store(delay)
     """
+    if getattr(_pending_stores, "stores", None) is not None:
+        yield
+        return
+    _pending_stores.stores = {}
     try:
-        if load(instrument.name) == instrument:
+        yield
+        stores = _pending_stores.stores
+    finally:
+        del _pending_stores.stores
+    # locks are always taken in the same order, so that transactions cannot deadlock
+    with contextlib.ExitStack() as stack:
+        for name in sorted(stores):
+            stack.enter_context(_lock(name))
+        _store_many([stores[name] for name in sorted(stores)])
+
+
+def _store_many(stores):
+    """Write (instrument, warn, compression, format, defer_data) stores, holding their locks."""
+    plans = []
+    for instrument, warn, compression, format, defer_data in stores:
+        try:
+            head = load(instrument.name)
+        except ValueError:
+            head = None  # Could mean it is not yet in store at all
+        if head is not None and head == instrument:
             if warn:
                 warnings.warn(
                     "Attempted to store instrument equivalent to current head, ignoring."
                 )
-            return
-    except ValueError:
-        pass  # Could mean it is not yet in store at all
-
-    if instrument.load is None and instrument.transition.previous is not None:
-        store(instrument.transition.previous, warn=False)
+            continue
 
-    if instrument.load is not None:
-        restore(instrument.name, instrument.load)
+        # collect the transitions applied in memory since the head (or a stored version)
+        chain = []
+        base = instrument
+        while base is not None and base.load is None:
+            if head is not None and base == head:
+                break
+            chain.append(base)
+            base = base.transition.previous
+        # a chain built on an older stored version first restores that version
+        if base is None or base.load is None or base == head:
+            base = None
+        plans.append((chain, base, compression, format, defer_data))
+    if not plans:
         return
 
-    _store_instr(instrument)
+    # everything becomes visible at once: versions leading up to the new heads are written
+    # with consecutive timestamps, then every new head with one shared timestamp
+    n_versions = sum(len(chain) + (base is not None) for chain, base, *_ in plans)
+    txn = _Transaction() if n_versions > 1 else None
+    writes = []
+    for chain, base, compression, format, defer_data in plans:
+        steps = [
+            functools.partial(_store_instr, i, compression, defer_data, format=format)
+            for i in chain
+        ]
+        if base is not None:
+            restored = load(base.name, base.load)
+            steps.append(functools.partial(_store_restore, restored, compression, format=format))
+        writes.append(steps[::-1])
+    time = None
+    for steps in writes:
+        for step in steps[:-1]:
+            time = step(after=time, txn=txn)
+    now = datetime.now(timezone.utc)
+    now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    if time is not None and now <= time:
+        now = time + timedelta(milliseconds=1)
+    for steps in writes:
+        time = steps[-1](at=now, txn=txn)
+    if txn is not None:
+        # consecutive timestamps may run ahead of the clock, a head must not be in the future
+        delay = (time - datetime.now(timezone.utc)).total_seconds()
+        if delay > 0:
+            sleep(delay)
+        txn.commit()
+
+
+def _store_instr(
+    instrument, compression=None, defer_data=False, *, format=None, after=None, at=None, txn=None
+):
+    """Write one version, returning its timestamp.
+
+    The timestamp is ``at`` if given, otherwise the current time or the next available
+    millisecond after ``after``.
+    Versions written as part of a transaction are not visible until it commits.
+    """
+    instrument_dir = _store_dir() / instrument.name
+    instrument_dir.mkdir(parents=True, exist_ok=True)
+    # the version is written in full to a hidden directory, then renamed into place,
+    # so that readers never see a partially written version
+    tmpdir = instrument_dir / f".tmp-{uuid.uuid4().hex}"
+    tmpdir.mkdir()
+    try:
+        # store instrument
+        _write_instr(instrument, tmpdir / "instrument.json", compression, format)
+        # store data
+        data = instrument.transition.data
+        if data is not None and defer_data:
+            (tmpdir / "data.pending").touch()
+        elif data is not None:
+            data.save(tmpdir / "data.wt5")
+        # store old instrument
+        if instrument.transition.previous is not None:
+            _write_instr(
+                instrument.transition.previous,
+                tmpdir / "previous_instrument.json",
+                compression,
+                format,
+            )
+        if txn is not None:
+            with open(tmpdir / "txn", "w") as f:
+                f.write(txn.id)
+        if at is not None:
+            now = at
+        else:
+            now = datetime.now(timezone.utc)
+            now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+            if after is not None and now <= after:
+                now = after + timedelta(milliseconds=1)
+        while True:
+            # make datadir
+            datadir = instrument_dir
+            datadir /= f"{now.year}"
+            datadir /= f"{now.month:02}"
+            datadir.mkdir(parents=True, exist_ok=True)
+            datadir /= now.isoformat(timespec="milliseconds").replace("-", "").replace(":", "")
+            try:
+                os.rename(tmpdir, datadir)
+            except OSError:
+                if datadir.exists():
+                    now += timedelta(milliseconds=1)
+                    continue
+                raise
+            else:
+                break
+    except BaseException:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        raise
+    if txn is not None:
+        txn.datadirs.append(datadir)
+    else:
+        _write_head(instrument_dir, datadir.name)
+    if data is not None and defer_data:
+        _defer_data(data, datadir)
+    return now
+
 
+class _Transaction:
+    def __init__(self):
+        """A set of versions which become visible together.
 
-def _store_instr(instrument):
-    if "ATTUNE_STORE" in os.environ and os.environ["ATTUNE_STORE"]:
-        attune_dir = pathlib.Path(os.environ["ATTUNE_STORE"])
-    else:
-        attune_dir = pathlib.Path(appdirs.user_data_dir("attune", "attune"))
+        Each version written in the transaction holds a ``txn`` marker file naming it,
+        and is ignored by readers until the commit record ``.txn/<id>`` exists.
+        """
+        self.id = uuid.uuid4().hex
+        self.datadirs = []
 
-    while True:
-        now = datetime.now(timezone.utc)
-        # make datadir
-        datadir = attune_dir
-        datadir /= instrument.name
-        datadir /= f"{now.year}"
-        datadir /= f"{now.month:02}"
-        datadir /= now.isoformat(timespec="milliseconds").replace("-", "").replace(":", "")
+    def commit(self):
+        txndir = _store_dir() / ".txn"
+        txndir.mkdir(exist_ok=True)
+        # creating the record is the single step which makes every version visible
+        open(txndir / self.id, "x").close()
+        for datadir in self.datadirs:
+            os.remove(datadir / "txn")
+        os.remove(txndir / self.id)
+        heads = {datadir.parents[2]: datadir.name for datadir in self.datadirs}
+        for instrument_dir, head in heads.items():
+            _write_head(instrument_dir, head)
+
+
+def _write_head(instrument_dir, name):
+    """Point ``name/HEAD`` at the newest version, which watchers poll for changes."""
+    tmp = instrument_dir / f".tmp-{uuid.uuid4().hex}"
+    with open(tmp, "x") as f:
+        f.write(name)
+    os.replace(tmp, instrument_dir / "HEAD")
+
+
+# --- background data writer ----------------------------------------------------------------------
+
+_data_executor = None
+_data_futures = set()
+
+
+def _write_data(data, datadir):
+    tmp = data.save(datadir / ".data.tmp.wt5", verbose=False)
+    os.replace(tmp, datadir / "data.wt5")
+    os.remove(datadir / "data.pending")
+
+
+def _defer_data(data, datadir):
+    global _data_executor
+    if _data_executor is None:
+        # one thread, so that data files are written in the order they were stored
+        # worker threads are joined at interpreter exit, so pending data is not lost
+        _data_executor = ThreadPoolExecutor(1, thread_name_prefix="attune-data")
+    future = _data_executor.submit(_write_data, data, datadir)
+    _data_futures.add(future)
+    future.add_done_callback(_forget_data)
+
+
+def _forget_data(future):
+    # failed writes are kept, to be reported by flush_data
+    if future.exception() is None:
+        _data_futures.discard(future)
+
+
+def flush_data(timeout=None):
+    """Wait for data files deferred by :meth:`attune.store` to be written.
+
+    Parameters
+    ----------
+    timeout: float, optional
+        Maximum number of seconds to wait, by default waits until all are written.
+
+    Raises
+    ------
+    TimeoutError
+        If some data files are still being written after ``timeout``.
+    Exception
+        The first error encountered while writing a data file, if any.
+        The corresponding versions keep their ``data.pending`` marker.
+    """
+    done, not_done = wait(list(_data_futures), timeout)
+    _data_futures.difference_update(done)
+    errors = [f.exception() for f in done if f.exception() is not None]
+    if not_done:
+        raise TimeoutError(f"{len(not_done)} data files are still being written")
+    if errors:
+        raise errors[0]
+
+
+_held_locks = threading.local()
+
+
+@contextlib.contextmanager
+def _lock(name):
+    """Hold the (reentrant) write lock of an instrument, shared by all processes."""
+    held = _held_locks.__dict__.setdefault("counts", {})
+    # kept out of the instrument directory, which locking a name must not create
+    path = _store_dir() / ".locks" / name
+    if held.get(path):
+        held[path] += 1
         try:
-            datadir.mkdir(parents=True)
-        except FileExistsError:
-            continue
+            yield
+        finally:
+            held[path] -= 1
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        f.seek(0)
+        if sys.platform == "win32":
+            import msvcrt
+
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                except OSError:
+                    continue  # LK_LOCK gives up after 10 seconds
+                break
         else:
-            break
-    # store instrument
-    with open(datadir / "instrument.json", "w") as f:
-        instrument.save(f)
-        f.write("\n")
-    # store data
-    if instrument.transition.data is not None:
-        instrument.transition.data.save(datadir / "data.wt5")
-    # store old instrument
-    if instrument.transition.previous is not None:
-        with open(datadir / "previous_instrument.json", "w") as f:
-            instrument.transition.previous.save(f)
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        held[path] = 1
+        try:
+            yield
+        finally:
+            del held[path]
+            if sys.platform == "win32":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+# --- versions and archives ----------------------------------------------------------------------
+#
+# Each version lives either in its own directory, name/YYYY/MM/<timestamp>/, or, once a month
+# has been compacted, as members <timestamp>/<file> of the archive name/YYYY/MM.zip.
+# Archives are uncompressed zip files (the members may themselves be compressed), the central
+# directory of each is read once and cached until the archive changes.
+
+
+class _Version:
+    def __init__(self, name, path, members=None):
+        """One stored version of an instrument.
+
+        Parameters
+        ----------
+        name: str
+            The timestamp which names the version.
+        path: pathlib.Path
+            The version directory, or the archive containing the version.
+        members: Optional[Dict[str, zipfile.ZipInfo]]
+            For archived versions, the archive members of the version by file name.
+        """
+        self.name = name
+        self.path = path
+        self.members = members
+        self.time = _parse_version_name(name)
+
+    def __repr__(self):
+        return f"_Version({repr(self.name)}, {repr(self.path)})"
+
+    @property
+    def archived(self):
+        return self.members is not None
+
+    def committed(self):
+        """Whether the version is visible: not part of a transaction which has yet to commit."""
+        if self.archived:
+            return True
+        marker = self.path / "txn"
+        try:
+            with open(marker, "r") as f:
+                txn = f.read()
+        except FileNotFoundError:
+            return True
+        # markers are removed after the commit record is written, and before it is removed
+        return (_store_dir() / ".txn" / txn).exists() or not marker.exists()
+
+    def files(self):
+        """Names of the files stored with this version."""
+        if self.archived:
+            return list(self.members)
+        return [p.name for p in self.path.iterdir()]
+
+    def read(self, filename):
+        """Raw contents of one of the files stored with this version."""
+        if not self.archived:
+            with open(self.path / filename, "rb") as f:
+                return f.read()
+        info = self.members[filename]
+        if info.compress_type != zipfile.ZIP_STORED:
+            with zipfile.ZipFile(self.path) as z:
+                return z.read(info)
+        # read straight from the local header, avoiding another parse of the central directory
+        with open(self.path, "rb") as f:
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            f.seek(name_length + extra_length, os.SEEK_CUR)
+            return f.read(info.compress_size)
+
+
+def _parse_version_name(name):
+    # names are written as e.g. 20201019T224232.700+0000, anything else goes the slow way
+    if len(name) == 24 and name[8] == "T" and name[15] == "." and name[19:] == "+0000":
+        try:
+            return datetime(
+                int(name[0:4]),
+                int(name[4:6]),
+                int(name[6:8]),
+                int(name[9:11]),
+                int(name[11:13]),
+                int(name[13:15]),
+                int(name[16:19]) * 1000,
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    return dateutil.parser.isoparse(name)
+
+
+_archive_cache = {}
+
+
+def _archive_versions(path):
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _archive_cache.get(path)
+    if cached is None or cached[0] != key:
+        members = {}
+        with zipfile.ZipFile(path) as z:
+            for info in z.infolist():
+                version, _, filename = info.filename.partition("/")
+                if filename:
+                    members.setdefault(version, {})[filename] = info
+        versions = [_Version(name, path, m) for name, m in members.items()]
+        cached = _archive_cache[path] = (key, versions)
+    return cached[1]
+
+
+def _month_versions(instrument_dir, year, month):
+    """All versions of an instrument stored in the given month, in no particular order."""
+    datadir = instrument_dir / str(year) / f"{month:02}"
+    out = []
+    if datadir.exists():
+        out += [_Version(d.name, d) for d in datadir.iterdir() if not d.name.startswith(".")]
+    archive = datadir.with_suffix(".zip")
+    if archive.exists():
+        out += _archive_versions(archive)
+    return out
+
+
+def _version_months(instrument_dir):
+    """The (year, month) pairs in which an instrument has stored versions, sorted."""
+    months = {
+        (int(p.parent.name), int(p.name[:2]))
+        for p in instrument_dir.glob("[0-9]*/[0-9][0-9]*")
+        if not p.name.startswith(".")
+    }
+    return sorted(months)
+
+
+def _all_versions(instrument_dir):
+    """All versions of an instrument, loose or archived, sorted by time."""
+    for year, month in _version_months(instrument_dir):
+        yield from sorted(_month_versions(instrument_dir, year, month), key=lambda v: v.time)
+
+
+# --- content-addressed objects -------------------------------------------------------------------
+#
+# Stored instruments do not embed their arrangements and tunes.
+# Each tune and arrangement is written once to the shared object directory, keyed by the
+# sha256 of its JSON text, and the instrument file refers to it as {"$ref": <key>}.
+# Versions which share tunes (the overwhelming majority) therefore share the bytes on disk.
+
+
+def _objects_dir():
+    return _store_dir() / ".objects"
+
+
+def _default(obj):
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj):
+    return json.dumps(obj, default=_default)
+
+
+def _touch(path):
+    """Refresh the modification time of an object which is reused, if it exists.
+
+    :meth:`attune.gc` spares objects modified since it began, so that an object reused by a
+    version being stored concurrently is not removed as unreferenced.
+    """
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _write_object(obj, compression=None, format=None):
+    if format == "binary":
+        raw = _binary.dumps(obj)
+    elif format == "json-base64":
+        raw = _dumps(_schema.encode(obj)).encode()
+    else:
+        raw = _dumps(obj).encode()
+    # the key addresses the encoded object, so it does not depend on the codec used to write it
+    key = hashlib.sha256(raw).hexdigest()
+    path = _objects_dir() / key[:2] / key
+    if not _touch(path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # concurrent writers of the same object write the same bytes, the last replace wins
+        tmp = path.with_name(f".tmp-{uuid.uuid4().hex}")
+        with open(tmp, "xb") as f:
+            f.write(_compression.compress(raw, compression))
+        os.replace(tmp, path)
+    return {"$ref": key}
+
+
+def _loads(raw):
+    raw = _compression.decompress(raw)
+    if _binary.is_binary(raw):
+        return _binary.loads(raw)
+    return _schema.loads(raw)
+
+
+def _read_json(path):
+    # objects are read rather than memory mapped, each map would hold a file descriptor open
+    # for as long as its tune lives
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def _read_object(ref, objects_dir=None):
+    key = ref["$ref"]
+    if objects_dir is None:
+        objects_dir = _objects_dir()
+    return _read_json(objects_dir / key[:2] / key)
+
+
+_object_keys = {}  # digest of a tune's points and units to the key of its object
+
+
+def _tune_digest(tune, format):
+    # hashing the points directly is much faster than encoding them to find the object key
+    h = hashlib.sha256(repr((format, tune.ind_units, tune.dep_units, len(tune))).encode())
+    h.update(tune.independent.tobytes())
+    h.update(tune.dependent.tobytes())
+    return h.digest()
+
+
+def _write_instr(instrument, path, compression=None, format=None):
+    d = instrument.as_dict()
+    for arr_name, arr in d["arrangements"].items():
+        for k, tune in instrument.arrangements[arr_name].tunes.items():
+            digest = _tune_digest(tune, format) if isinstance(tune, Tune) else None
+            key = _object_keys.get(digest)
+            # tunes written before (e.g. shared with the previous instrument) are not encoded
+            if key is None or not _touch(_objects_dir() / key[:2] / key):
+                key = _write_object(arr["tunes"][k], compression, format)["$ref"]
+                if digest is not None:
+                    _object_keys[digest] = key
+            arr["tunes"][k] = {"$ref": key}
+        d["arrangements"][arr_name] = _write_object(arr, compression)
+    replace = _merge_record(d)
+    if replace is not None:
+        # the replacing tunes recorded by update_merge are tunes of the merged instrument,
+        # the record refers to their objects rather than embedding their points again
+        replace = {
+            arr_name: {
+                **arr,
+                "tunes": {
+                    k: _write_object(v, compression, format) if "$ref" not in v else v
+                    for k, v in arr["tunes"].items()
+                },
+            }
+            for arr_name, arr in replace.items()
+        }
+        metadata = {**d["transition"]["metadata"]}
+        metadata["replace"] = {**metadata["replace"], "arrangements": replace}
+        d["transition"] = {**d["transition"], "metadata": metadata}
+    if format == "json-base64":
+        d = {"schema": _schema.SCHEMA, **_schema.encode(d)}
+    with open(path, "wb") as f:
+        f.write(_compression.compress((_dumps(d) + "\n").encode(), compression))
+
+
+def _read_instr(version, filename="instrument.json", load=None):
+    d = _resolve(_loads(version.read(filename)))
+    return Instrument(**d, load=load)
+
+
+def _resolve(d, objects_dir=None):
+    """Replace the references to objects in the dictionary of a stored instrument."""
+
+    def read(tunes):
+        return {k: _read_object(v, objects_dir) if "$ref" in v else v for k, v in tunes.items()}
+
+    # versions written before deduplication embed their arrangements directly
+    for arr_name, arr in d["arrangements"].items():
+        if "$ref" in arr:
+            arr = _read_object(arr, objects_dir)
+        arr["tunes"] = read(arr["tunes"])
+        d["arrangements"][arr_name] = arr
+    replace = _merge_record(d)
+    if replace is not None:
+        for arr in replace.values():
+            arr["tunes"] = read(arr["tunes"])
+    return d
+
+
+def _merge_record(d):
+    """The replacing arrangements recorded by an update_merge transition, if any."""
+    transition = d.get("transition") or {}
+    if transition.get("type") != "update_merge":
+        return None
+    return transition["metadata"].get("replace", {}).get("arrangements")
+
+
+def _recompress_file(path, compression):
+    with open(path, "rb") as f:
+        old = f.read()
+    new = _compression.compress(_compression.decompress(old), compression)
+    if new != old:
+        tmp = path.with_name(f".{path.name}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(new)
+        os.replace(tmp, path)
+    return len(old), len(new)
+
+
+def _recompress_archive(path, compression):
+    old_size = new_size = 0
+    changed = False
+    tmp = path.with_name(f".{path.name}.tmp")
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(tmp, "w", zipfile.ZIP_STORED) as z:
+        for info in src.infolist():
+            raw = src.read(info)
+            if info.filename.rpartition("/")[2] in ("instrument.json", "previous_instrument.json"):
+                new = _compression.compress(_compression.decompress(raw), compression)
+                old_size += len(raw)
+                new_size += len(new)
+                changed |= new != raw
+                raw = new
+            z.writestr(info, raw)
+    if changed:
+        os.replace(tmp, path)
+    else:
+        os.remove(tmp)
+    return old_size, new_size
+
+
+def recompress(compression=None, *, workers=None):
+    """Rewrite every instrument file in the store with the given compression.
+
+    Files are processed in parallel, each is replaced only once fully rewritten.
+    Instrument files of versions archived by :meth:`attune.compact` are rewritten within
+    their archives, which are replaced as a whole.
+    Data files (``data.wt5``) are left as they are.
+
+    Parameters
+    ----------
+    compression: str, optional
+        Codec to use, "zlib", "lzma" or "none".
+        Defaults to the ATTUNE_STORE_COMPRESSION environment variable, if set,
+        otherwise files are decompressed.
+    workers: int, optional
+        Number of worker processes, by default the number of processors.
+
+    Returns
+    -------
+    tuple of int
+        Total size in bytes before and after recompression.
+    """
+    compression = _compression.resolve(compression)
+    attune_dir = _store_dir()
+    paths = [p for p in attune_dir.glob(".objects/*/*") if not p.name.startswith(".")]
+    paths += attune_dir.glob("*/*/*/*/instrument.json")
+    paths += attune_dir.glob("*/*/*/*/previous_instrument.json")
+    archives = [
+        p for p in attune_dir.glob("*/[0-9]*/[0-9][0-9].zip") if not p.name.startswith(".")
+    ]
+    with ProcessPoolExecutor(workers) as executor:
+        sizes = list(
+            executor.map(_recompress_file, paths, [compression] * len(paths), chunksize=64)
+        )
+        sizes += executor.map(_recompress_archive, archives, [compression] * len(archives))
+    return sum(old for old, _ in sizes), sum(new for _, new in sizes)
 
 
 def undo(instrument):
@@ -24,6 +24,7 @@ class TransitionType(str, Enum):
     setpoint = "setpoint"
     holistic = "holistic"
     update_merge = "update_merge"
+    apply_edits = "apply_edits"
 
 
 class Transition:
@@ -54,6 +55,13 @@ class Transition:
         self.metadata = metadata
         self.data = data
 
+    def __getstate__(self):
+        # data objects are backed by open files, they are not sent
+        return {"type": self.type, "previous": self.previous, "metadata": self.metadata}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
     def __repr__(self):
         return f"Transition({repr(self.type)}, {repr(self.previous)}, {repr(self.metadata)})"
 
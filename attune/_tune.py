@@ -27,13 +27,50 @@ class Tune:
         Note: kwargs are provided to make the serialized dictionary with ind_units
         easy to initialize into a Tune object, but are currently ignored.
         """
-        independent = np.asarray(independent)
-        dependent = np.asarray(dependent)
+        independent = _points(independent)
+        dependent = _points(dependent)
         assert independent.size == dependent.size
         assert independent.ndim == dependent.ndim == 1
+        if (np.diff(independent) < 0).any():
+            order = np.argsort(independent, kind="mergesort")
+            independent, dependent = independent[order], dependent[order]
+            independent.flags.writeable = dependent.flags.writeable = False
         self._ind_units = "nm"
         self._dep_units = dep_units
-        self._interp = scipy.interpolate.interp1d(independent, dependent, fill_value="extrapolate")
+        self._independent = independent
+        self._dependent = dependent
+        self._interpolator = None
+
+    def __getstate__(self):
+        # the interpolator is rebuilt on demand, only the points are sent
+        return {
+            "independent": self._independent,
+            "dependent": self._dependent,
+            "dep_units": self._dep_units,
+        }
+
+    def __setstate__(self, state):
+        # the points were checked and sorted when the tune was made, and the unpickled
+        # arrays belong to this tune alone
+        self._independent = state["independent"]
+        self._dependent = state["dependent"]
+        self._independent.flags.writeable = self._dependent.flags.writeable = False
+        self._ind_units = "nm"
+        self._dep_units = state["dep_units"]
+        self._interpolator = None
+
+    @property
+    def _interp(self):
+        # built on first evaluation, many tunes of a loaded instrument are never called
+        if self._interpolator is None:
+            self._interpolator = scipy.interpolate.interp1d(
+                self._independent,
+                self._dependent,
+                copy=False,
+                assume_sorted=True,
+                fill_value="extrapolate",
+            )
+        return self._interpolator
 
     @property
     def _leaf(self):
@@ -78,21 +115,21 @@ class Tune:
     def as_dict(self):
         """Serialize this Tune as a python dictionary."""
         out = {}
-        out["independent"] = list(self.independent)
-        out["dependent"] = list(self.dependent)
+        out["independent"] = self.independent.tolist()
+        out["dependent"] = self.dependent.tolist()
         out["ind_units"] = self.ind_units
         out["dep_units"] = self.dep_units
         return out
 
     @property
     def independent(self):
-        """The independent (input) values for the tune points."""
-        return self._interp.x.astype(float)
+        """The independent (input) values for the tune points, sorted (read only)."""
+        return self._independent
 
     @property
     def dependent(self):
-        """The dependent (output) values for the tune points."""
-        return self._interp.y.astype(float)
+        """The dependent (output) values for the tune points (read only)."""
+        return self._dependent
 
     @property
     def ind_max(self):
@@ -119,3 +156,14 @@ class Tune:
         """Whether or not the dependent variable moves monotonically."""
         checks = np.gradient(self.dependent) <= 0
         return checks.all() or (not checks.any())
+
+
+def _points(values):
+    """A read only float array of points, arrays which are already read only are not copied."""
+    arr = np.asarray(values, dtype=float)
+    if arr.flags.writeable:
+        # the tune must not change along with an array it was given
+        if arr is values or arr.base is not None:
+            arr = arr.copy()
+        arr.flags.writeable = False
+    return arr
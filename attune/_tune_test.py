@@ -7,8 +7,8 @@ import WrightTools as wt
 from ._discrete_tune import DiscreteTune
 from ._instrument import Instrument
 from ._transition import Transition
-from ._plot import plot_tune_test
 from ._common import save
+from ._report import RenderReport
 from ._map import map_ind_points
 
 __all__ = ["tune_test"]
@@ -40,6 +40,7 @@ def tune_test(
     restore_setpoints=True,
     autosave=True,
     save_directory=None,
+    plot=True,
     **spline_kwargs,
 ) -> Instrument:
     """Workup a Tune Test.
@@ -66,6 +67,10 @@ def tune_test(
         toggles saving of instrument file and images (Defaults to True)
     save_directory: Path-like
         where to save (Defaults to current working directory)
+    plot: bool, optional
+        toggles drawing the figure (Defaults to True).
+        If False, no figure is made or saved, and a RenderReport which draws it on
+        demand is returned along with the instrument.
     **spline_kwargs: optional
         extra arguments to pass to spline creation (e.g. s=0, k=1 for linear interpolation)
 
@@ -73,6 +78,8 @@ def tune_test(
     -------
     attune.Instrument
         New instrument object.
+    attune.RenderReport
+        Only with ``plot=False``, draws the figure of the workup on demand.
 
     Example
     -------
@@ -151,12 +158,19 @@ def tune_test(
 
     new_instrument._transition = transition
 
-    fig, _ = plot_tune_test(
+    report = RenderReport(
+        "tune_test",
+        "plot_tune_test",
         data,
         channel.natural_name,
         used_offsets=offset_spline(setpoints),
         raw_offsets=raw_offsets,
     )
+    if not plot:
+        if autosave:
+            save(new_instrument, None, "tune_test", save_directory)
+        return new_instrument, report
+    fig = report.render()
 
     if autosave:
         save(new_instrument, fig, "tune_test", save_directory)
@@ -16,7 +16,9 @@ def update_merge(base: Instrument, replace: Instrument) -> Instrument:
             continue
         for tune_name, tune in arr.items():
             instr["arrangements"][arr_name]["tunes"][tune_name] = tune
-    transition = Transition(type="update_merge", previous=base)
+    # the replacing arrangements are recorded so that the transition can be replayed,
+    # the store refers to their tunes rather than writing them again
+    record = {"arrangements": {k: v.as_dict() for k, v in replace.arrangements.items()}}
+    transition = Transition(type="update_merge", previous=base, metadata={"replace": record})
     instr.pop("transition", None)
-    print(repr(transition))
     return Instrument(**instr, transition=transition)
@@ -0,0 +1,159 @@
+"""Notification of new store heads."""
+
+__all__ = ["watch"]
+
+from datetime import datetime, timezone
+import os
+import threading
+import warnings
+
+from ._store import _store_dir, _all_versions, _month_versions, _parse_version_name, _read_instr
+
+_pollers = {}
+_pollers_lock = threading.Lock()
+
+
+def watch(name, callback, *, interval=1.0):
+    """Call a function with each new head of an instrument in the store.
+
+    Every store writes a small ``HEAD`` file next to the history of the instrument,
+    so noticing a new head costs a single ``stat`` per poll, rather than a walk of the store.
+    All watches of an instrument share one background thread, which loads each new head
+    once and passes the same (immutable) Instrument object to every callback.
+    Heads stored by any process, including this one, are reported.
+
+    Parameters
+    ----------
+    name: str
+        The key of the instrument to watch.
+    callback: callable
+        Called (from the polling thread) with each new head Instrument.
+        Exceptions raised by the callback are turned into warnings.
+    interval: float, optional
+        Seconds between polls, default is 1.
+        Watches of the same instrument poll at the shortest interval requested.
+
+    Returns
+    -------
+    object
+        A handle whose ``stop()`` method ends the watch.
+        It may also be used as a context manager, which stops the watch on exit.
+    """
+    key = (_store_dir(), name)
+    subscription = _Subscription(key, callback, interval)
+    with _pollers_lock:
+        poller = _pollers.get(key)
+        if poller is None:
+            poller = _pollers[key] = _Poller(*key)
+        poller.subscriptions.append(subscription)
+        poller.wake()
+    return subscription
+
+
+class _Subscription:
+    def __init__(self, key, callback, interval):
+        self.key = key
+        self.callback = callback
+        self.interval = interval
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def stop(self):
+        """End the watch, the callback is not called again once this returns."""
+        with _pollers_lock:
+            poller = _pollers.get(self.key)
+            if poller is None or self not in poller.subscriptions:
+                return
+            poller.subscriptions.remove(self)
+            if not poller.subscriptions:
+                del _pollers[self.key]
+                poller.stopped.set()
+            poller.wake()
+        # wait for a delivery in progress, unless stopped from within the callback
+        if threading.current_thread() is not poller.thread:
+            with poller.delivering:
+                pass
+
+
+class _Poller:
+    def __init__(self, store_dir, name):
+        """The thread which polls the head of one instrument for all of its watches."""
+        self.instrument_dir = store_dir / name
+        self.name = name
+        self.subscriptions = []
+        self.stopped = threading.Event()
+        self.woken = threading.Event()
+        self.delivering = threading.Lock()
+        self.signature = _head_signature(self.instrument_dir)
+        head = _head_version(self.instrument_dir)
+        # only heads stored after the watch began are reported
+        self.head = None if head is None else head.time
+        self.thread = threading.Thread(target=self.run, name=f"attune-watch-{name}", daemon=True)
+        self.thread.start()
+
+    def wake(self):
+        # the interval may have changed
+        self.woken.set()
+
+    def run(self):
+        while not self.stopped.is_set():
+            with _pollers_lock:
+                interval = min((s.interval for s in self.subscriptions), default=0)
+            if self.woken.wait(interval):
+                self.woken.clear()
+                continue
+            signature = _head_signature(self.instrument_dir)
+            if signature == self.signature:
+                continue
+            self.signature = signature
+            version = _head_version(self.instrument_dir)
+            if version is None or version.time == self.head:
+                continue
+            try:
+                instr = _read_instr(version, load=version.time)
+            except OSError:
+                # e.g. moved into an archive meanwhile, the head is looked up again at next poll
+                self.signature = None
+                continue
+            self.head = version.time
+            with self.delivering:
+                with _pollers_lock:
+                    subscriptions = list(self.subscriptions)
+                for subscription in subscriptions:
+                    try:
+                        subscription.callback(instr)
+                    except Exception as e:
+                        warnings.warn(f"Exception in callback watching '{self.name}': {e!r}")
+
+
+def _head_signature(instrument_dir):
+    try:
+        stat = os.stat(instrument_dir / "HEAD")
+    except FileNotFoundError:
+        # stores written before HEAD files existed: new versions appear in the current month
+        now = datetime.now(timezone.utc)
+        try:
+            stat = os.stat(instrument_dir / str(now.year) / f"{now.month:02}")
+        except FileNotFoundError:
+            return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _head_version(instrument_dir):
+    try:
+        with open(instrument_dir / "HEAD") as f:
+            name = f.read()
+    except FileNotFoundError:
+        pass
+    else:
+        time = _parse_version_name(name)
+        for version in _month_versions(instrument_dir, time.year, time.month):
+            if version.name == name:
+                return version
+    # no HEAD file, or its version has since been moved
+    committed = [v for v in _all_versions(instrument_dir) if v.committed()]
+    return committed[-1] if committed else None
@@ -3,6 +3,7 @@ __all__ = ["from_topas3"]
 import numpy as np
 import warnings
 
+from attune._intern import _intern
 from attune._tune import Tune
 from attune._arrangement import Arrangement
 from attune._instrument import Instrument
@@ -71,12 +72,12 @@ def _read_file(filepath):
 
             # Ignore the case of "NON-NON-NON-NON", which is just the pump source
             if any(v != "NON" for v in source_interaction):
-                source_tune = Tune(arr[1], arr[0], units="nm")
+                source_tune = _intern(Tune(arr[1], arr[0], units="nm"))
                 tunes["-".join(source_interaction)] = source_tune
 
             for i in range(n_motors):
                 name = str(motor_indexes[i])
-                tunes[name] = Tune(arr[1], arr[i + 3])
+                tunes[name] = _intern(Tune(arr[1], arr[i + 3]))
 
             curves[interaction_string] = Arrangement(interaction_string, tunes)
     return curves
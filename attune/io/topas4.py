@@ -9,6 +9,7 @@ from .. import DiscreteTune
 from .. import Instrument
 from .. import Setable
 from .. import Tune
+from .._intern import _intern
 
 
 def from_topas4(topas4_folder):
@@ -124,7 +125,8 @@ def from_topas4(topas4_folder):
 
     for arr, mots in discrete_tunes.items():
         for mot_name, pos in mots.items():
-            tune = DiscreteTune(pos)
+            # the same ranges apply to every matching arrangement
+            tune = _intern(DiscreteTune(pos))
             arrangements[arr]["tunes"][mot_name] = tune
 
     instr = Instrument(arrangements, setables)
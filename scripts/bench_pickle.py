@@ -0,0 +1,88 @@
+"""Compare pickling of instruments with and without their custom pickle state.
+
+The "default" rows pickle every object's ``__dict__``, as pickle did before Tune and
+friends defined ``__getstate__``, including the interpolator each evaluated Tune holds.
+
+    python scripts/bench_pickle.py --arrangements 50 --tunes 10 --points 200
+"""
+
+import argparse
+import copyreg
+import io
+import pickle
+import time
+
+import numpy as np
+
+
+def _set_dict(obj, state):
+    obj.__dict__.update(state)
+
+
+class DefaultPickler(pickle.Pickler):
+    def reducer_override(self, obj):
+        import attune
+
+        types = (attune.Tune, attune.DiscreteTune, attune.Arrangement, attune.Instrument)
+        if isinstance(obj, types + (attune._transition.Transition,)):
+            args = (type(obj), object, None)
+            return copyreg._reconstructor, args, obj.__dict__, None, None, _set_dict
+        return NotImplemented
+
+
+def _default_dumps(obj):
+    f = io.BytesIO()
+    DefaultPickler(f, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return f.getvalue()
+
+
+def _dumps(obj):
+    return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def _best(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--arrangements", type=int, default=50)
+    parser.add_argument("--tunes", type=int, default=10)
+    parser.add_argument("--points", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import attune
+
+    rng = np.random.default_rng(0)
+    x = np.linspace(1100, 1600, args.points)
+    arrangements = {}
+    for a in range(args.arrangements):
+        tunes = {f"tune{t}": attune.Tune(x, rng.normal(size=x.size)) for t in range(args.tunes)}
+        arrangements[f"arr{a}"] = attune.Arrangement(f"arr{a}", tunes)
+    instr = attune.Instrument(arrangements, name="bench")
+    # evaluate every tune, as a worker would have, so that interpolators exist
+    for arr in instr.arrangements.values():
+        for tune in arr.tunes.values():
+            tune(1300)
+    instr = attune.offset_by(instr, "arr0", "tune0", 1.0)
+
+    print(f"{args.arrangements} arrangements x {args.tunes} tunes x {args.points} points")
+    for label, dumps in [("default", _default_dumps), ("custom", _dumps)]:
+        raw = dumps(instr)
+        assert pickle.loads(raw) == instr
+        t_dump = _best(lambda: dumps(instr), args.repeat)
+        t_load = _best(lambda: pickle.loads(raw), args.repeat)
+        print(
+            f"{label:>8}: {len(raw) / 1e6:6.2f} MB, dumps {t_dump * 1e3:7.1f} ms, "
+            f"loads {t_load * 1e3:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Time serialization of large synthetic instruments.
+
+Compares Instrument.save with the previous implementation (``list(ndarray)`` in
+Tune.as_dict, streamed through a JSONEncoder subclass) and checks that the output is
+byte-identical, then times storing the instrument and its previous instrument.
+
+    python scripts/bench_serialization.py --arrangements 4 --tunes 8 --points 10000
+"""
+
+import argparse
+import io
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+
+def _instrument(n_arrangements, n_tunes, n_points):
+    import attune
+
+    rng = np.random.default_rng(0)
+    arrangements = {}
+    for a in range(n_arrangements):
+        x = np.linspace(1100, 1600, n_points)
+        tunes = {f"tune{t}": attune.Tune(x, rng.normal(size=n_points)) for t in range(n_tunes)}
+        arrangements[f"arr{a}"] = attune.Arrangement(f"arr{a}", tunes)
+    return attune.Instrument(arrangements, name="bench")
+
+
+def _legacy_save(instrument, file):
+    class NdarrayEncoder(json.JSONEncoder):
+        def default(self, obj):
+            if hasattr(obj, "tolist"):
+                return obj.tolist()
+            return json.JSONEncoder.default(self, obj)
+
+    d = instrument.as_dict()
+    for arr in d["arrangements"].values():
+        for name, tune in arr["tunes"].items():
+            tune = arr["tunes"][name] = dict(tune)
+            tune["independent"] = list(np.asarray(tune["independent"]))
+            tune["dependent"] = list(np.asarray(tune["dependent"]))
+    json.dump(d, file, cls=NdarrayEncoder)
+
+
+def _best(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--arrangements", type=int, default=4)
+    parser.add_argument("--tunes", type=int, default=8)
+    parser.add_argument("--points", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tdir:
+        os.environ["ATTUNE_STORE"] = tdir
+        import attune
+
+        instr = _instrument(args.arrangements, args.tunes, args.points)
+        n = args.arrangements * args.tunes * args.points
+        print(f"{args.arrangements} arrangements x {args.tunes} tunes x {args.points} points")
+
+        legacy, current = io.StringIO(), io.StringIO()
+        _legacy_save(instr, legacy)
+        instr.save(current)
+        assert legacy.getvalue() == current.getvalue(), "output differs"
+        print(f"output is byte-identical, {len(current.getvalue()) / 1e6:.1f} MB")
+
+        for label, func in [
+            ("as_dict", instr.as_dict),
+            ("legacy save", lambda: _legacy_save(instr, io.StringIO())),
+            ("save", lambda: instr.save(io.StringIO())),
+            ("save base64", lambda: instr.save(io.StringIO(), format="json-base64")),
+        ]:
+            t = _best(func, args.repeat)
+            print(f"{label:>12}: {t * 1e3:8.1f} ms ({n / t / 1e6:.1f} M points/s)")
+
+        attune.store(instr)
+        amounts = iter(range(1, args.repeat + 1))
+        t = _best(
+            lambda: attune.store(attune.offset_by(instr, "arr0", "tune0", next(amounts))),
+            args.repeat,
+        )
+        print(f"{'store':>12}: {t * 1e3:8.1f} ms (with previous_instrument.json)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Stress the store with concurrent writer and reader processes.
+
+Each writer stores a sequence of offsets to the same instrument, while readers
+continuously load its head. At the end every version in the history is loaded
+and the number of stored offsets is checked.
+
+    python scripts/bench_store_concurrency.py --writers 8 --readers 4 --stores 20
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+
+def _write(i, n_stores, n_writers):
+    import attune
+
+    for j in range(n_stores):
+        instr = attune.load("bench")
+        # distinct powers of two, so that no store can be equivalent to the head
+        amount = 2.0 ** (j * n_writers + i)
+        attune.store(attune.offset_by(instr, "arr", "tune", amount), warn=False)
+
+
+def _read(stop):
+    import attune
+
+    loads, errors = 0, 0
+    while not stop.is_set():
+        try:
+            attune.load("bench")
+        except Exception:
+            errors += 1
+        loads += 1
+    return loads, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--stores", type=int, default=10, help="stores per writer")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tdir:
+        os.environ["ATTUNE_STORE"] = tdir
+        import attune
+
+        tune = attune.Tune([0, 1], [0, 1])
+        instr = attune.Instrument({"arr": attune.Arrangement("arr", {"tune": tune})}, name="bench")
+        attune.store(instr)
+
+        with multiprocessing.Manager() as manager, multiprocessing.Pool(
+            args.writers + args.readers
+        ) as pool:
+            stop = manager.Event()
+            readers = [pool.apply_async(_read, (stop,)) for _ in range(args.readers)]
+            start = time.perf_counter()
+            writers = [
+                pool.apply_async(_write, (i, args.stores, args.writers))
+                for i in range(args.writers)
+            ]
+            for w in writers:
+                w.get()
+            elapsed = time.perf_counter() - start
+            stop.set()
+            reads = [r.get() for r in readers]
+
+        history = list(attune.WalkHistory("bench"))
+        offsets = sum(i.transition.type == "offset_by" for i in history)
+        n_stores = args.writers * args.stores
+        print(f"{n_stores} stores by {args.writers} writers in {elapsed:.2f} s")
+        print(f"{n_stores / elapsed:.1f} stores/s, {len(history)} versions in history")
+        print(f"{sum(r[0] for r in reads)} head loads, {sum(r[1] for r in reads)} failed")
+        print(f"{offsets} of {n_stores} offsets found in history")
+        assert offsets == n_stores
+        assert not any(r[1] for r in reads)
+
+
+if __name__ == "__main__":
+    main()
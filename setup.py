@@ -26,7 +26,7 @@ setup(
     name="attune",
     packages=find_packages(exclude=("tests", "tests.*")),
     package_data=extra_files,
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     install_requires=[
         "WrightTools>=3.2.5",
         "numpy",
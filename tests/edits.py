@@ -0,0 +1,71 @@
+import attune
+import numpy as np
+
+import pytest
+
+
+def _instrument():
+    x = np.linspace(1300, 1400, 21)
+    sig = attune.Arrangement("sig", {"c1": attune.Tune(x, x / 10), "d1": attune.Tune(x, -x)})
+    idl = attune.Arrangement("idl", {"c1": attune.Tune(x + 200, x / 20)})
+    return attune.Instrument({"sig": sig, "idl": idl}, name="opa")
+
+
+def test_apply_edits():
+    inst0 = _instrument()
+    edits = [
+        {"type": "offset_by", "arrangement": "sig", "tune": "c1", "amount": 1.0},
+        {
+            "type": "offset_to",
+            "arrangement": "sig",
+            "tune": "d1",
+            "destination": 0,
+            "setpoint": 1350,
+        },
+        {"type": "map_ind_points", "arrangement": "sig", "tune": "c1", "setpoints": [1300, 1400]},
+        {"type": "map_ind_limits", "arrangement": "idl", "tune": "c1", "min": 1550, "max": 1560},
+    ]
+    inst1 = attune.apply_edits(inst0, edits)
+
+    expected = attune.offset_by(inst0, "sig", "c1", 1.0)
+    expected = attune.offset_to(expected, "sig", "d1", 0, 1350)
+    expected = attune.map_ind_points(expected, "sig", "c1", [1300, 1400])
+    expected = attune.map_ind_limits(expected, "idl", "c1", 1550, 1560)
+    assert inst1 == expected
+    np.testing.assert_allclose(inst1["sig"]["c1"].dependent, [131, 141])
+    # the input is unchanged
+    assert inst0 == _instrument()
+
+    assert inst1.transition.type == "apply_edits"
+    assert inst1.transition.previous is inst0
+    md = inst1.transition.metadata["edits"]
+    assert [e["type"] for e in md] == [e["type"] for e in edits]
+    assert md[0] == {
+        "type": "offset_by",
+        "arrangement": "sig",
+        "tune": "c1",
+        "amount": 1.0,
+        "amount_units": None,
+    }
+
+
+def test_copies():
+    inst0 = _instrument()
+    edits = [
+        {"type": "offset_by", "arrangement": "sig", "tune": "c1", "amount": i} for i in range(8)
+    ]
+    inst1 = attune.apply_edits(inst0, edits)
+    np.testing.assert_allclose(inst1["sig"]["c1"].dependent, inst0["sig"]["c1"].dependent + 28)
+    assert inst1["idl"] is inst0["idl"]
+    assert inst1["sig"] is not inst0["sig"]
+    assert inst1["sig"]["d1"] is inst0["sig"]["d1"]
+    assert len(inst1.transition.metadata["edits"]) == 8
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        attune.apply_edits(_instrument(), [{"type": "rotate", "arrangement": "sig", "tune": "c1"}])
+    with pytest.raises(TypeError):
+        attune.apply_edits(
+            _instrument(), [{"type": "offset_by", "arrangement": "sig", "tune": "c1"}]
+        )
@@ -0,0 +1,64 @@
+import io
+from pathlib import Path
+
+import attune
+import numpy as np
+
+topas4_dir = Path(__file__).parent.parent / "io" / "twin_test_data"
+
+
+def _instrument():
+    x = np.linspace(1300, 1400, 11)
+    tunes = {"c1": attune.Tune(x, x / 10), "g": attune.DiscreteTune({"a": (1300, 1400)})}
+    arrangements = {name: attune.Arrangement(name, dict(tunes)) for name in ("sig", "idl")}
+    return attune.Instrument(arrangements, name="opa")
+
+
+def _open(instrument):
+    f = io.StringIO()
+    instrument.save(f)
+    f.seek(0)
+    return attune.open(f)
+
+
+def test_within_instrument():
+    instr = _open(_instrument())
+    assert instr["sig"]["c1"] is instr["idl"]["c1"]
+    assert instr["sig"]["g"] is instr["idl"]["g"]
+
+
+def test_across_instruments():
+    first = _open(_instrument())
+    second = _open(_instrument())
+    assert first["sig"]["c1"] is second["idl"]["c1"]
+    changed = _open(attune.offset_by(first, "sig", "c1", 1))
+    assert changed["sig"]["c1"] is not first["sig"]["c1"]
+    assert changed["idl"]["c1"] is first["idl"]["c1"]
+    assert changed == attune.offset_by(first, "sig", "c1", 1)
+
+
+def test_topas4():
+    first = attune.from_topas4(topas4_dir)
+    second = attune.from_topas4(topas4_dir)
+    for name, arr in first.arrangements.items():
+        for tune_name, tune in arr.tunes.items():
+            assert second[name][tune_name] is tune
+    report = attune.memory_report(first, second)
+    assert report["unique_tunes"] == report["tunes"] // 2
+    assert report["saved_nbytes"] == report["shared_nbytes"]
+
+
+def test_memory_report():
+    built = _instrument()
+    report = attune.memory_report(built)
+    assert report["tunes"] == 4
+    assert report["unique_tunes"] == 2
+    instr = _open(built)
+    instr(1350, "sig")
+    report = attune.memory_report(instr, _open(built))
+    assert report["tunes"] == 8
+    assert report["unique_tunes"] == 2
+    assert report["interpolators"] == 1
+    assert report["nbytes"] == 4 * 2 * 11 * 8
+    assert report["shared_nbytes"] == 2 * 11 * 8
+    assert report["saved_nbytes"] == 3 * 2 * 11 * 8
@@ -0,0 +1,32 @@
+import os
+import tempfile
+
+import attune
+
+
+def test_open_many():
+    tune = attune.Tune([0, 1], [0, 1])
+    with tempfile.TemporaryDirectory() as tdir:
+        paths, expected = [], []
+        for i in range(10):
+            inst = attune.Instrument(
+                {"arr": attune.Arrangement("arr", {"tune": tune})}, name=f"inst{i}"
+            )
+            paths.append(os.path.join(tdir, f"{i}.json"))
+            with open(paths[-1], "w") as f:
+                inst.save(f)
+            expected.append(inst)
+        paths.insert(3, os.path.join(tdir, "missing.json"))
+        with open(os.path.join(tdir, "broken.json"), "w") as f:
+            f.write("{")
+        paths.append(os.path.join(tdir, "broken.json"))
+
+        results = list(attune.open_many(paths, workers=2, chunksize=4))
+        assert [p for p, _ in results] == paths
+        instruments = [r for _, r in results if not isinstance(r, Exception)]
+        assert instruments == expected
+        assert isinstance(results[3][1], FileNotFoundError)
+        assert isinstance(results[-1][1], ValueError)
+
+        unordered = list(attune.open_many(paths, workers=2, ordered=False))
+        assert sorted(p for p, _ in unordered) == sorted(paths)
@@ -0,0 +1,69 @@
+import pickle
+
+import attune
+import numpy as np
+
+
+def _instrument():
+    x = np.linspace(1300, 1400, 21)
+    sig = attune.Arrangement(
+        "sig",
+        {
+            "c1": attune.Tune(x, x / 10, dep_units="deg"),
+            "d1": attune.Tune(x[::-1], np.sqrt(x)),
+            "g": attune.DiscreteTune({"a": (1300, 1350), "b": (1350, 1400)}),
+        },
+    )
+    idl = attune.Arrangement(
+        "idl", {"sig": attune.Tune(np.linspace(1500, 1600, 5), np.linspace(1400, 1300, 5))}
+    )
+    setables = {"c1": attune.Setable("c1"), "d2": attune.Setable("d2", default=3)}
+    return attune.Instrument({"sig": sig, "idl": idl}, setables, name="opa")
+
+
+def test_round_trip():
+    inst = _instrument()
+    packed = attune.pack(inst)
+    assert packed.offsets.tolist() == [0, 42, 84]
+    assert packed.lengths.tolist() == [21, 21, 5]
+    assert packed.buffer.size == 94
+    unpacked = packed.unpack()
+    assert unpacked == inst
+    assert unpacked.name == "opa"
+    assert unpacked.setables == inst.setables
+    assert unpacked["sig"]["c1"].dep_units == "deg"
+    assert isinstance(unpacked["sig"]["g"], attune.DiscreteTune)
+    assert attune.pack(unpacked).header == packed.header
+
+
+def test_views():
+    packed = attune.pack(_instrument())
+    inst = packed.unpack()
+    for arr in inst.arrangements.values():
+        for tune in arr.tunes.values():
+            if isinstance(tune, attune.Tune):
+                assert np.shares_memory(tune.independent, packed.buffer)
+                assert np.shares_memory(tune.dependent, packed.buffer)
+                assert not tune.dependent.flags.writeable
+    assert not packed.buffer.flags.writeable
+
+
+def test_call():
+    inst = _instrument()
+    packed = attune.pack(inst)
+    for value in [1300, 1333.3, 1400, 1550]:
+        assert packed(value).setable_positions == inst(value).setable_positions
+    assert packed.instrument is packed.instrument
+
+
+def test_pickle():
+    packed = attune.pack(_instrument())
+    unpickled = pickle.loads(pickle.dumps(packed))
+    assert np.array_equal(unpickled.buffer, packed.buffer)
+    assert unpickled.unpack() == packed.unpack()
+
+
+def test_empty():
+    packed = attune.pack(attune.Instrument({}, name="empty"))
+    assert packed.buffer.size == 0
+    assert packed.unpack() == attune.Instrument({}, name="empty")
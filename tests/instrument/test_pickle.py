@@ -0,0 +1,44 @@
+import copy
+import pickle
+
+import attune
+import numpy as np
+
+
+def _instrument():
+    tune = attune.Tune(np.linspace(0, 1, 11), np.linspace(0, 1, 11) ** 2, dep_units="mm")
+    discrete_tune = attune.DiscreteTune({"hi": (0.8, 1.0), "lo": (0.1, 0.2)}, default="med")
+    arr = attune.Arrangement("arr", {"tune": tune, "discrete": discrete_tune})
+    return attune.Instrument({"arr": arr}, {"tune": attune.Setable("tune")}, name="inst")
+
+
+def test_pickle_round_trip():
+    inst = _instrument()
+    inst(0.5)  # builds the interpolator
+    inst = attune.offset_by(inst, "arr", "tune", 1.0)
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        raw = pickle.dumps(inst, protocol)
+        assert b"interp1d" not in raw
+        unpickled = pickle.loads(raw)
+        assert unpickled == inst
+        assert unpickled.name == "inst"
+        assert unpickled.transition.type == "offset_by"
+        assert unpickled.transition.previous == inst.transition.previous
+        assert unpickled(0.5)["tune"] == inst(0.5)["tune"]
+        assert unpickled(0.9)["discrete"] == "hi"
+        assert unpickled["arr"]["tune"].dep_units == "mm"
+
+
+def test_pickle_drops_data():
+    inst = _instrument()
+    inst._transition = attune._transition.Transition("create", data=object())
+    assert pickle.loads(pickle.dumps(inst)).transition.data is None
+
+
+def test_deepcopy():
+    inst = _instrument()
+    inst(0.5)
+    copied = copy.deepcopy(inst)
+    assert copied["arr"]["tune"]._interpolator is None
+    assert copied == inst
+    assert not np.shares_memory(copied["arr"]["tune"].dependent, inst["arr"]["tune"].dependent)
@@ -1,7 +1,12 @@
+import io
+import json
 import math
+import os
 import tempfile
 
 import attune
+import numpy as np
+import pytest
 
 
 def test_construct_simple():
@@ -26,6 +31,101 @@ def test_asdict_smoke():
     print(inst.as_dict())
 
 
+def test_binary_round_trip():
+    x = np.linspace(1100, 1600, 1001)
+    tune = attune.Tune(x, np.sqrt(x), dep_units="mm")
+    discrete_tune = attune.DiscreteTune({"hi": (1500, 1600), "lo": (1100, 1200)}, default="med")
+    arr = attune.Arrangement("arr", {"tune": tune, "discrete": discrete_tune})
+    inst = attune.Instrument({"arr": arr}, {"tune": attune.Setable("tune")}, name="inst")
+    offset = attune.offset_by(inst, "arr", "tune", 0.5)
+    # transition metadata holding an array
+    mapped = attune.map_ind_points(inst, "arr", "tune", np.linspace(1200, 1500, 307))
+    for inst in (offset, mapped):
+        with tempfile.TemporaryDirectory() as tdir:
+            with open(os.path.join(tdir, "inst.json"), "w") as f:
+                inst.save(f)
+            with open(os.path.join(tdir, "inst.bin"), "wb") as f:
+                inst.save(f, format="binary")
+            from_json = attune.open(os.path.join(tdir, "inst.json"))
+            from_binary = attune.open(os.path.join(tdir, "inst.bin"))
+            with open(os.path.join(tdir, "inst.bin"), "rb") as f:
+                from_file = attune.open(f)
+            assert from_binary == from_json == from_file == inst
+            for reopened in (from_binary, from_file):
+                assert json.dumps(reopened.as_dict()) == json.dumps(from_json.as_dict())
+                np.testing.assert_array_equal(
+                    reopened["arr"]["tune"].dependent, inst["arr"]["tune"].dependent
+                )
+                assert reopened.transition.type == inst.transition.type
+            del from_binary  # release the memory map before the directory is removed
+    np.testing.assert_array_equal(offset["arr"]["tune"].dependent, tune.dependent + 0.5)
+
+
+def test_base64_round_trip():
+    x = np.linspace(1100, 1600, 1001)
+    tune = attune.Tune(x, np.sqrt(x), dep_units="mm")
+    arr = attune.Arrangement("arr", {"tune": tune})
+    inst = attune.Instrument({"arr": arr}, {"tune": attune.Setable("tune")}, name="inst")
+    inst = attune.map_ind_points(inst, "arr", "tune", np.linspace(1200, 1500, 307))
+    plain, compact = io.StringIO(), io.StringIO()
+    inst.save(plain)
+    inst.save(compact, format="json-base64")
+    assert len(compact.getvalue()) < len(plain.getvalue()) * 0.75
+    compact.seek(0)
+    reopened = attune.open(compact)
+    plain.seek(0)
+    assert reopened == attune.open(plain) == inst
+    np.testing.assert_array_equal(reopened["arr"]["tune"].dependent, inst["arr"]["tune"].dependent)
+    np.testing.assert_array_equal(
+        reopened.transition.metadata["setpoints"], inst.transition.metadata["setpoints"]
+    )
+    # numpy scalars in metadata
+    inst = attune.offset_by(inst, "arr", "tune", np.int64(1))
+    compact = io.StringIO()
+    inst.save(compact, format="json-base64")
+    compact.seek(0)
+    assert attune.open(compact).transition.metadata["amount"] == 1
+    with pytest.raises(ValueError, match="schema"):
+        attune.open(io.StringIO('{"schema": 3, "arrangements": {}}'))
+
+
+def test_tune_unsorted():
+    tune = attune.Tune([2, 0, 1], [4, 0, 2])
+    np.testing.assert_array_equal(tune.independent, [0, 1, 2])
+    np.testing.assert_array_equal(tune.dependent, [0, 2, 4])
+    assert tune(1.5) == 3
+
+
+def test_lazy_open():
+    x = np.linspace(0, 1, 11)
+    arrs = {
+        f"arr{i}": attune.Arrangement(f"arr{i}", {"tune": attune.Tune(x, x + i)}) for i in range(3)
+    }
+    inst = attune.Instrument(arrs, {"tune": attune.Setable("tune")}, name="inst")
+    with tempfile.TemporaryFile("w+t", suffix=".json") as tmp:
+        inst.save(tmp)
+        tmp.seek(0)
+        reopened = attune.open(tmp)
+    # nothing is built until used
+    assert all(isinstance(v, dict) for v in reopened._arrangements._items.values())
+    assert math.isclose(reopened(0.5, "arr1")["tune"], 1.5)
+    assert isinstance(reopened._arrangements._items["arr1"], attune.Arrangement)
+    assert isinstance(reopened._arrangements._items["arr2"], dict)
+    assert reopened["arr1"]["tune"]._interpolator is not None
+    assert reopened == inst
+    assert reopened.as_dict() == inst.as_dict()
+    # the public mappings are ordinary dicts of built values
+    for mapping in (reopened.arrangements, reopened["arr2"].tunes):
+        assert type(mapping) is dict
+        assert mapping.copy() == mapping
+    assert isinstance(reopened.arrangements["arr2"], attune.Arrangement)
+    assert reopened.arrangements is reopened.arrangements
+
+
 if __name__ == "__main__":
     test_construct_simple()
     test_asdict_smoke()
+    test_binary_round_trip()
+    test_base64_round_trip()
+    test_tune_unsorted()
+    test_lazy_open()
@@ -0,0 +1,90 @@
+import multiprocessing
+import os
+import pathlib
+import shutil
+import tempfile
+import uuid
+
+import attune
+import numpy as np
+import pytest
+
+here = pathlib.Path(__file__).parent
+
+
+def _instrument(offset=0):
+    x = np.linspace(1300, 1400, 11)
+    arr = attune.Arrangement(
+        "sig",
+        {"c1": attune.Tune(x, x / 10 + offset), "g": attune.DiscreteTune({"a": (1300, 1400)})},
+    )
+    return attune.Instrument({"sig": arr}, {"c1": attune.Setable("c1")}, name="opa")
+
+
+def _evaluate(name, value):
+    with attune.attach(name) as shared:
+        return shared.generation, float(shared(value)["c1"])
+
+
+def test_publish_attach():
+    name = uuid.uuid4().hex[:8]
+    assert attune.publish(_instrument(), name=name) == 1
+    try:
+        shared = attune.attach(name)
+        assert shared.generation == 1
+        assert not shared.stale
+        assert shared.instrument == _instrument()
+        assert shared(1350)["c1"] == pytest.approx(135)
+        assert np.shares_memory(shared.instrument["sig"]["c1"].dependent, shared.packed.buffer)
+        # a newer head
+        old = shared.instrument
+        assert attune.publish(_instrument(offset=1), name=name) == 2
+        assert shared.stale
+        assert shared(1350)["c1"] == pytest.approx(135)
+        assert shared.refresh()
+        assert not shared.refresh()
+        assert shared.generation == 2
+        assert shared(1350)["c1"] == pytest.approx(136)
+        assert old(1350)["c1"] == pytest.approx(135)
+        with pytest.raises(BufferError):
+            shared.close()
+        del old
+        shared.close()
+    finally:
+        attune.unpublish(name)
+    with pytest.raises(FileNotFoundError):
+        attune.attach(name)
+
+
+def test_other_process():
+    name = uuid.uuid4().hex[:8]
+    attune.publish(_instrument(), name=name)
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(1) as pool:
+            assert pool.apply(_evaluate, (name, 1350)) == (1, pytest.approx(135))
+            attune.publish(_instrument(offset=2), name=name)
+            assert pool.apply(_evaluate, (name, 1350)) == (2, pytest.approx(137))
+        # the segments outlive attached processes
+        with attune.attach(name) as shared:
+            assert shared.generation == 2
+    finally:
+        attune.unpublish(name)
+
+
+def test_publish_stored():
+    with tempfile.TemporaryDirectory() as tdir:
+        shutil.copytree(here.parent / "store" / "example_store", tdir + "/example_store")
+        os.environ["ATTUNE_STORE"] = tdir + "/example_store"
+        stored = attune.load("test")
+    mapped = attune.map_ind_points(stored, "arr", "tune", np.linspace(0.25, 1, 5))
+    for instrument in (stored, mapped):
+        name = uuid.uuid4().hex[:8]
+        attune.publish(instrument, name=name)
+        try:
+            with attune.attach(name) as shared:
+                assert shared.instrument == instrument
+                assert shared.instrument.load == instrument.load
+                assert shared.instrument.transition.type == instrument.transition.type
+        finally:
+            attune.unpublish(name)
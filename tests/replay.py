@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+
+import attune
+import numpy as np
+
+import pytest
+
+
+def _instrument():
+    x = np.linspace(1300, 1400, 21)
+    sig = attune.Arrangement("sig", {"c1": attune.Tune(x, x / 10), "d1": attune.Tune(x, -x)})
+    idl = attune.Arrangement("idl", {"c1": attune.Tune(x + 200, x / 20)})
+    return attune.Instrument({"sig": sig, "idl": idl}, name="opa")
+
+
+def _history(base):
+    x = np.linspace(1300, 1400, 5)
+    replace = attune.Instrument(
+        {"sig": attune.Arrangement("sig", {"d2": attune.Tune(x, x / 2)})}, name="other"
+    )
+    chain = [base]
+    chain.append(attune.offset_by(chain[-1], "sig", "c1", 1.0))
+    chain.append(attune.offset_to(chain[-1], "sig", "d1", 0, 1350))
+    chain.append(attune.map_ind_points(chain[-1], "sig", "c1", [1300, 1350, 1400]))
+    chain.append(attune.map_ind_limits(chain[-1], "idl", "c1", 1550, 1560))
+    edits = [{"type": "offset_by", "arrangement": "idl", "tune": "c1", "amount": 2}]
+    chain.append(attune.apply_edits(chain[-1], edits))
+    chain.append(attune.update_merge(chain[-1], replace))
+    return chain
+
+
+def test_replay():
+    chain = _history(_instrument())
+    chain.append(attune.rename(chain[-1], "opa2"))
+    replayed = attune.replay(chain[0], [instr.transition for instr in chain[1:]])
+    assert replayed == chain[-1]
+    assert replayed.name == "opa2"
+    assert replayed.transition.metadata == chain[-1].transition.metadata
+    # each step is recorded
+    assert replayed.transition.type == "rename"
+    assert replayed.transition.previous is None
+    assert replayed.arrangements == chain[-2].arrangements
+
+
+def test_replay_serialized():
+    chain = _history(_instrument())
+    transitions = [json.loads(json.dumps(i.transition.as_dict())) for i in chain[1:]]
+    assert attune.replay(chain[0], transitions) == chain[-1]
+
+
+def test_not_replayable():
+    instr = _instrument()
+    with pytest.raises(ValueError):
+        attune.replay(instr, [{"type": "holistic", "metadata": {}}])
+    with pytest.raises(ValueError):
+        attune.replay(instr, [{"type": "rename", "metadata": {"old_name": "opa"}}])
+
+
+def test_replay_store():
+    with tempfile.TemporaryDirectory() as tdir:
+        os.environ["ATTUNE_STORE"] = tdir
+        for instr in _history(_instrument()):
+            attune.store(instr)
+        first = attune.load("opa", "2000-01-01", reverse=False)
+        attune.restore("opa", first.load)
+        head = attune.load("opa")
+        assert head.transition.type == "restore"
+        stored = list(attune.WalkHistory("opa", start=first.load, reverse=False))
+        replayed = attune.replay(first, [i.transition for i in stored[1:]])
+        assert replayed == head
+        assert attune.replay(stored[-2], [head.transition]) == first
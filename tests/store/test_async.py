@@ -0,0 +1,55 @@
+import asyncio
+import os
+import pathlib
+import shutil
+import tempfile
+
+import attune
+
+here = pathlib.Path(__file__).parent
+
+
+def temp_store(func):
+    def inner():
+        with tempfile.TemporaryDirectory() as tdir:
+            shutil.copytree(here / "example_store", tdir + "/example_store")
+            os.environ["ATTUNE_STORE"] = tdir + "/example_store"
+            func()
+
+    return inner
+
+
+@temp_store
+def test_aload_astore():
+    async def main():
+        instr = await attune.aload("test")
+        assert instr == attune.load("test")
+        new = attune.offset_by(instr, "arr", "tune", 1.0)
+        await attune.astore(new)
+        assert await attune.aload("test") == new
+        await attune.arestore("test", "2020-10-19T22:42:32.700+0000")
+        assert (await attune.aload("test")).arrangements["arr"].ind_min == 0.0
+
+    asyncio.run(main())
+
+
+@temp_store
+def test_aload_shared():
+    async def main():
+        loads = await asyncio.gather(*[attune.aload("test") for _ in range(10)])
+        assert all(i is loads[0] for i in loads)
+
+    asyncio.run(main())
+
+
+@temp_store
+def test_aload_cancel():
+    async def main():
+        first = asyncio.ensure_future(attune.aload("test"))
+        second = asyncio.ensure_future(attune.aload("test"))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert (await second) == attune.load("test")
+        assert first.cancelled()
+
+    asyncio.run(main())
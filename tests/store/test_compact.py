@@ -0,0 +1,43 @@
+import os
+import pathlib
+import shutil
+import tempfile
+
+import attune
+
+here = pathlib.Path(__file__).parent
+
+
+def temp_store(func):
+    def inner():
+        with tempfile.TemporaryDirectory() as tdir:
+            shutil.copytree(here / "example_store", tdir + "/example_store")
+            os.environ["ATTUNE_STORE"] = tdir + "/example_store"
+            func()
+
+    return inner
+
+
+@temp_store
+def test_compact():
+    head = attune.load("test")
+    old = attune.load("test", "2020-10-19T22:42:32.700+0000")
+    store = pathlib.Path(os.environ["ATTUNE_STORE"])
+    archives = attune.compact()
+    assert archives == [store / "test" / "2020" / "10.zip"]
+    assert not (store / "test" / "2020" / "10").exists()
+    assert attune.load("test") == head
+    assert attune.load("test").load == head.load
+    assert attune.load("test", "2020-10-19T22:42:32.700+0000") == old
+    assert len(list(attune.WalkHistory("test"))) == 2
+
+
+@temp_store
+def test_store_after_compact():
+    attune.compact("test")
+    instr = attune.offset_by(attune.load("test"), "arr", "tune", 1.0)
+    attune.store(instr)
+    assert attune.load("test") == instr
+    attune.restore("test", "2020-10-19T22:42:32.700+0000")
+    assert attune.load("test").arrangements["arr"].ind_min == 0.0
+    assert len(list(attune.WalkHistory("test"))) == 4
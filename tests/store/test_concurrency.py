@@ -0,0 +1,58 @@
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+
+import attune
+
+here = pathlib.Path(__file__).parent
+
+
+def temp_store(func):
+    def inner():
+        with tempfile.TemporaryDirectory() as tdir:
+            shutil.copytree(here / "example_store", tdir + "/example_store")
+            os.environ["ATTUNE_STORE"] = tdir + "/example_store"
+            func()
+
+    return inner
+
+
+@temp_store
+def test_concurrent_writers_and_readers():
+    n_writers, n_stores = 4, 5
+    errors = []
+    done = threading.Event()
+
+    def write(i):
+        try:
+            for j in range(n_stores):
+                instr = attune.load("test")
+                # distinct powers of two, so that no store can be equivalent to the head
+                amount = 2.0 ** (i * n_stores + j)
+                attune.store(attune.offset_by(instr, "arr", "tune", amount), warn=False)
+        except Exception as e:
+            errors.append(e)
+
+    def read():
+        while not done.is_set():
+            try:
+                attune.load("test")
+            except Exception as e:
+                errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    writers = [threading.Thread(target=write, args=(i,)) for i in range(n_writers)]
+    for t in readers + writers:
+        t.start()
+    for t in writers:
+        t.join()
+    done.set()
+    for t in readers:
+        t.join()
+
+    assert not errors
+    history = list(attune.WalkHistory("test"))
+    assert sum(i.transition.type == "offset_by" for i in history) == n_writers * n_stores
+    assert not list((pathlib.Path(os.environ["ATTUNE_STORE"]) / "test").glob(".tmp-*"))
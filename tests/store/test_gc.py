@@ -0,0 +1,74 @@
+import os
+import pathlib
+import shutil
+import tempfile
+from datetime import timedelta
+
+import attune
+import pytest
+
+here = pathlib.Path(__file__).parent
+
+
+def temp_store(func):
+    def inner():
+        with tempfile.TemporaryDirectory() as tdir:
+            shutil.copytree(here / "example_store", tdir + "/example_store")
+            os.environ["ATTUNE_STORE"] = tdir + "/example_store"
+            func()
+
+    return inner
+
+
+@temp_store
+def test_gc_keeps_daily_heads():
+    head = attune.load("test")
+    report = attune.gc(dry_run=True)
+    assert report.versions == 1
+    assert len(list(attune.WalkHistory("test"))) == 2
+    report = attune.gc()
+    assert report.versions == 1
+    assert report.inodes == 2
+    assert report.bytes > 0
+    assert [i.load for i in attune.WalkHistory("test")] == [head.load]
+    with pytest.raises(ValueError):
+        attune.load("test", "2020-10-19T22:42:32.700+0000")
+
+
+@temp_store
+def test_gc_keeps_restore_targets():
+    attune.restore("test", "2020-10-19T22:42:32.700+0000")
+    report = attune.gc(attune.RetentionPolicy(keep_all=timedelta(0)))
+    assert report.versions == 0
+    assert attune.load("test", "2020-10-19T22:42:32.700+0000").arrangements["arr"].ind_min == 0
+
+
+@temp_store
+def test_gc_objects_and_archives():
+    instr = attune.load("test")
+    for amount in (1.0, 2.0, 3.0):
+        instr = attune.offset_by(instr, "arr", "tune", amount)
+        attune.store(instr)
+    attune.compact("test")
+    objects = pathlib.Path(os.environ["ATTUNE_STORE"]) / ".objects"
+    before = len(list(objects.glob("*/*")))
+    report = attune.gc(attune.RetentionPolicy(keep_all=timedelta(0)))
+    # the two oldest stored versions are dropped, as is the archived version of 2020-10-19
+    assert report.versions == 3
+    assert report.objects == before - len(list(objects.glob("*/*")))
+    assert attune.load("test") == instr
+    assert len(list(attune.WalkHistory("test"))) == 2
+
+
+@temp_store
+def test_gc_spares_reused_objects():
+    objects = pathlib.Path(os.environ["ATTUNE_STORE"]) / ".objects"
+    instr = attune.offset_by(attune.load("test"), "arr", "tune", 1.0)
+    attune.store(instr)
+    for path in objects.glob("*/*"):
+        os.utime(path, (0, 0))
+    # the arrangement and tune objects of the renamed instrument are reused rather than written
+    attune.store(attune.rename(instr, "other"))
+    assert len([path for path in objects.glob("*/*") if path.stat().st_mtime > 0]) == 2
+    assert attune.gc().objects == 0
+    assert attune.load("other")["arr"] == instr["arr"]
@@ -0,0 +1,44 @@
+import os
+import pathlib
+import shutil
+import tempfile
+
+import attune
+
+here = pathlib.Path(__file__).parent
+
+
+def temp_store(func):
+    def inner():
+        with tempfile.TemporaryDirectory() as tdir:
+            shutil.copytree(here / "example_store", tdir + "/example_store")
+            os.environ["ATTUNE_STORE"] = tdir + "/example_store"
+            func()
+
+    return inner
+
+
+@temp_store
+def test_snapshot():
+    tune = attune.Tune([0, 1], [0, 1])
+    other = attune.Instrument({"arr": attune.Arrangement("arr", {"tune": tune})}, name="other")
+    attune.store(other)
+    snap = attune.snapshot()
+    assert sorted(snap) == ["other", "test"]
+    assert snap["test"] == attune.load("test")
+    assert snap["other"] == other
+    assert snap.versions["other"] == attune.load("other").load
+
+
+@temp_store
+def test_snapshot_past():
+    tune = attune.Tune([0, 1], [0, 1])
+    other = attune.Instrument({"arr": attune.Arrangement("arr", {"tune": tune})}, name="other")
+    attune.store(other)
+    time = "2020-10-19T22:42:32.700+0000"
+    snap = attune.snapshot(time)
+    # instruments stored later are not part of the past
+    assert list(snap) == ["test"]
+    assert snap["test"] == attune.load("test", time)
+    record = snap.as_dict()
+    assert record == {"time": snap.time.isoformat(), "versions": {"test": record["time"]}}
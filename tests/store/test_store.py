@@ -56,3 +56,311 @@ def test_store_ndarray():
     # Would raise here because it is trying to serialize the ndarray in metadata
     # prior to bug fix
     attune.store(instr)
+
+
+@temp_store
+def test_store_deduplicates_tunes():
+    instr = attune.load("test")
+    instr = attune.offset_by(instr, "arr", "tune", 1.0)
+    attune.store(instr)
+    instr = attune.offset_by(instr, "arr", "tune", -1.0)
+    attune.store(instr)
+    objects = pathlib.Path(os.environ["ATTUNE_STORE"]) / ".objects"
+    # two distinct tunes, each in its own arrangement, written once each
+    assert len(list(objects.glob("*/*"))) == 4
+    assert attune.load("test") == instr
+    head = sorted((pathlib.Path(os.environ["ATTUNE_STORE"]) / "test").glob("*/*/*"))[-1]
+    assert "$ref" in (head / "instrument.json").read_text()
+    assert "$ref" in (head / "previous_instrument.json").read_text()
+
+
+@temp_store
+def test_store_compressed():
+    instr = attune.load("test")
+    instr = attune.offset_by(instr, "arr", "tune", 1.0)
+    attune.store(instr, compression="lzma")
+    head = sorted((pathlib.Path(os.environ["ATTUNE_STORE"]) / "test").glob("*/*/*"))[-1]
+    assert (head / "instrument.json").read_bytes().startswith(b"\xfd7zXZ")
+    assert attune.load("test") == instr
+
+
+@temp_store
+def test_recompress():
+    instr = attune.load("test")
+    attune.store(attune.offset_by(instr, "arr", "tune", 1.0), compression="zlib")
+    before, after = attune.recompress("lzma", workers=2)
+    assert after != before
+    for path in pathlib.Path(os.environ["ATTUNE_STORE"]).glob("test/*/*/*/*.json"):
+        assert path.read_bytes().startswith(b"\xfd7zXZ")
+    old = pathlib.Path(os.environ["ATTUNE_STORE"]) / "test/2020/10/20201019T224232.700+0000"
+    assert attune.open(old / "instrument.json").name == "test"
+    assert attune.load("test") == attune.offset_by(instr, "arr", "tune", 1.0)
+
+
+@temp_store
+def test_recompress_archived():
+    import zipfile
+
+    attune.compact("test")
+    archive = pathlib.Path(os.environ["ATTUNE_STORE"]) / "test/2020/10.zip"
+    before, after = attune.recompress("zlib", workers=2)
+    assert after < before
+    with zipfile.ZipFile(archive) as z:
+        for info in z.infolist():
+            if info.filename.endswith(".json"):
+                assert z.read(info).startswith(b"\x78")
+    assert attune.load("test", "2020-10-19T22:42:32.700+0000").arrangements["arr"].ind_min == 0
+    assert attune.recompress("zlib", workers=2)[0] == after
+
+
+@temp_store
+def test_store_defer_data():
+    import WrightTools as wt
+
+    data = wt.Data()
+    data.create_variable("x", np.linspace(0, 1, 5))
+    data.transform("x")
+    instr = attune.load("test")
+    instr = attune.offset_by(instr, "arr", "tune", 1.0)
+    instr._transition.data = data
+    attune.store(instr, defer_data=True)
+    assert attune.load("test") == instr
+    attune.flush_data(timeout=60)
+    head = sorted((pathlib.Path(os.environ["ATTUNE_STORE"]) / "test").glob("*/*/*"))[-1]
+    assert sorted(p.name for p in head.iterdir()) == [
+        "data.wt5",
+        "instrument.json",
+        "previous_instrument.json",
+    ]
+    assert wt.open(head / "data.wt5").x.size == 5
+
+
+@temp_store
+def test_store_chain():
+    instr = attune.load("test")
+    for amount in range(1, 6):
+        instr = attune.offset_by(instr, "arr", "tune", amount)
+    loads = []
+    load = attune._store.load
+    attune._store.load = lambda *args: loads.append(args) or load(*args)
+    try:
+        attune.store(instr)
+    finally:
+        attune._store.load = load
+    assert len(loads) == 1
+    history = list(attune.WalkHistory("test"))
+    assert history[0] == instr
+    amounts = [i.transition.metadata.get("amount") for i in history[:5]]
+    assert amounts == [5, 4, 3, 2, 1]
+    times = [i.load for i in history[:5]]
+    assert times == sorted(times, reverse=True)
+
+
+@temp_store
+def test_store_chain_from_old_version():
+    old = attune.load("test", "2020-10-19T22:42:32.700+0000")
+    instr = attune.offset_by(attune.offset_by(old, "arr", "tune", 1.0), "arr", "tune", 1.0)
+    attune.store(instr)
+    types = [i.transition.type for i in attune.WalkHistory("test")]
+    assert types[:3] == ["offset_by", "offset_by", "restore"]
+
+
+@temp_store
+def test_transaction_visibility():
+    head = attune.load("test")
+    txn = attune._store._Transaction()
+    instr = attune.offset_by(head, "arr", "tune", 1.0)
+    attune._store._store_instr(instr, txn=txn)
+    assert attune.load("test") == head
+    txn.commit()
+    assert attune.load("test") == instr
+
+
+def test_parse_time():
+    from datetime import datetime, timedelta, timezone
+    from attune._store import _parse_time
+
+    expected = datetime(2020, 10, 19, 22, 42, 32, 700000, tzinfo=timezone.utc)
+    assert _parse_time("2020-10-19T22:42:32.700+0000") == expected
+    assert _parse_time("2020-10-19T22:42:32.700") == expected
+    assert _parse_time("20201019T224232.700+0000") == expected
+    assert _parse_time(expected.timestamp()) == expected
+    assert _parse_time(str(expected.timestamp())) == expected
+    assert _parse_time(expected) is expected
+    # short strings of digits are dates rather than timestamps
+    assert _parse_time("2020") == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert _parse_time("20201019") == datetime(2020, 10, 19, tzinfo=timezone.utc)
+    assert _parse_time("1603147352") == expected.replace(microsecond=0)
+    memo = {}
+    ago = _parse_time("5 minutes ago", memo)
+    assert abs(datetime.now(timezone.utc) - timedelta(minutes=5) - ago) < timedelta(seconds=5)
+    assert _parse_time("5 minutes ago", memo) is ago
+    with pytest.raises(ValueError):
+        _parse_time("not a time at all")
+
+
+def test_no_dateparser_import():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, attune; attune._store._parse_time('2020-10-19');"
+        "print('dateparser' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+@temp_store
+def test_store_transaction():
+    tune = attune.Tune([0, 1], [0, 1])
+    other = attune.Instrument({"arr": attune.Arrangement("arr", {"tune": tune})}, name="other")
+    head = attune.load("test")
+    instr = attune.offset_by(attune.offset_by(head, "arr", "tune", 1.0), "arr", "tune", 1.0)
+    with attune.store_transaction():
+        attune.store(instr)
+        attune.store(other)
+        assert attune.load("test") == head
+        assert "other" not in attune.catalog()
+    assert attune.load("test") == instr
+    assert attune.load("other") == other
+    # both new heads share a timestamp, after the intermediate version
+    assert attune.load("test").load == attune.load("other").load
+    history = list(attune.WalkHistory("test"))
+    assert history[1].transition.type == "offset_by"
+    assert history[1].load < history[0].load
+
+
+@temp_store
+def test_store_transaction_error():
+    head = attune.load("test")
+    with pytest.raises(RuntimeError):
+        with attune.store_transaction():
+            attune.store(attune.offset_by(head, "arr", "tune", 1.0))
+            raise RuntimeError
+    assert attune.load("test") == head
+    assert attune.load("test").load == head.load
+
+
+@temp_store
+def test_history_matrix():
+    instr = attune.load("test")
+    for amount in (1.0, 2.0):
+        instr = attune.offset_by(instr, "arr", "tune", amount)
+        attune.store(instr)
+    setpoints = [0.25, 0.5, 2.0]
+    times, values = attune.history_matrix("test", "arr", "tune", setpoints)
+    history = list(attune.WalkHistory("test"))[::-1]
+    assert values.shape == (len(history), 3)
+    expected = [i["arr"]["tune"](setpoints) for i in history]
+    np.testing.assert_allclose(values, expected)
+    assert list(times) == [np.datetime64(i.load.replace(tzinfo=None), "ms") for i in history]
+    times, values = attune.history_matrix("test", "arr", "tune", setpoints, start=history[-2].load)
+    assert values.shape == (2, 3)
+    times, values = attune.history_matrix("test", "arr", "nope", setpoints)
+    assert np.isnan(values).all()
+    discrete = attune.DiscreteTune({"lo": (0, 0.5), "hi": (0.5, 1)})
+    merged = attune.Instrument({"arr": attune.Arrangement("arr", {"discrete": discrete})})
+    attune.store(attune.update_merge(attune.load("test"), merged))
+    with pytest.raises(TypeError, match="discrete"):
+        attune.history_matrix("test", "arr", "discrete", setpoints)
+
+
+@temp_store
+def test_store_binary():
+    instr = attune.offset_by(attune.load("test"), "arr", "tune", 1.0)
+    attune.store(instr, format="binary")
+    loaded = attune.load("test")
+    assert loaded == instr
+    assert loaded["arr"]["tune"].dependent.base is not None  # a view of the object read
+    attune.store(attune.offset_by(loaded, "arr", "tune", 1.0), format="binary", compression="zlib")
+    assert attune.load("test")["arr"]["tune"](0.5) == loaded["arr"]["tune"](0.5) + 1.0
+    assert len(list(attune.WalkHistory("test"))) == 4
+
+
+@temp_store
+def test_store_binary_file_descriptors():
+    fds = pathlib.Path("/proc/self/fd")
+    if not fds.exists():
+        pytest.skip("needs /proc")
+    x = np.linspace(0, 1, 11)
+    arrs = {
+        f"arr{a}": attune.Arrangement(
+            f"arr{a}", {f"t{t}": attune.Tune(x, x + a + t) for t in range(10)}
+        )
+        for a in range(10)
+    }
+    attune.store(attune.Instrument(arrs, name="many"), format="binary")
+    before = len(list(fds.iterdir()))
+    loaded = attune.load("many")
+    assert loaded["arr9"]["t9"](0.5) == 18.5
+    # the tune objects are not memory mapped, which would keep a descriptor open each
+    assert len(list(fds.iterdir())) <= before + 1
+
+
+@temp_store
+def test_store_base64():
+    instr = attune.load("test")
+    instr = attune.map_ind_points(instr, "arr", "tune", np.linspace(0, 1, 101))
+    attune.store(instr, format="json-base64")
+    loaded = attune.load("test")
+    assert loaded == instr
+    np.testing.assert_array_equal(loaded.transition.metadata["setpoints"], np.linspace(0, 1, 101))
+
+
+@temp_store
+def test_restore_missing():
+    with pytest.raises(ValueError, match="No instrument found with name 'typo'"):
+        attune.restore("typo", "2020-10-19T22:42:32.700+0000")
+    assert attune.catalog() == ["test"]
+    assert list(attune.catalog(full=True)) == ["test"]
+
+
+@temp_store
+def test_store_update_merge():
+    instr = attune.load("test")
+    x = np.linspace(0, 1, 1001)
+    replace = attune.Instrument({"arr": attune.Arrangement("arr", {"new": attune.Tune(x, x)})})
+    merged = attune.update_merge(instr, replace)
+    attune.store(merged)
+    # the replacing tune is recorded as a reference to its object, not as its points
+    head = pathlib.Path(os.environ["ATTUNE_STORE"]) / "test"
+    head = next(head.glob(f"*/*/{(head / 'HEAD').read_text()}"))
+    assert len((head / "instrument.json").read_bytes()) < 1000
+    loaded = attune.load("test")
+    assert loaded.transition.metadata["replace"] == merged.transition.metadata["replace"]
+    assert attune.replay(instr, [loaded.transition]) == merged
+
+
+@temp_store
+def test_restore_codec():
+    store = pathlib.Path(os.environ["ATTUNE_STORE"]) / "test"
+    old = "2020-10-19T22:42:32.700+0000"
+    with pytest.raises(ValueError, match="compression"):
+        attune.restore("test", old, compression="nope")
+    attune.restore("test", old, compression="none")
+    head = next(store.glob(f"*/*/{(store / 'HEAD').read_text()}"))
+    assert (head / "instrument.json").read_bytes().startswith(b"{")
+    attune.restore("test", "2020-10-19T22:42:32.701+0000")
+    os.environ["ATTUNE_STORE_COMPRESSION"] = "lzma"
+    try:
+        attune.restore("test", old, format="binary")
+    finally:
+        del os.environ["ATTUNE_STORE_COMPRESSION"]
+    head = next(store.glob(f"*/*/{(store / 'HEAD').read_text()}"))
+    assert (head / "instrument.json").read_bytes().startswith(b"\xfd7zXZ")
+    assert attune.load("test").arrangements["arr"].ind_min == 0
+
+
+@temp_store
+def test_open_stored_file():
+    instr = attune.offset_by(attune.load("test"), "arr", "tune", 1.0)
+    attune.store(instr)
+    store = pathlib.Path(os.environ["ATTUNE_STORE"]) / "test"
+    head = next(store.glob(f"*/*/{(store / 'HEAD').read_text()}"))
+    assert attune.open(head / "instrument.json") == instr
+    assert attune.open(head / "previous_instrument.json") == instr.transition.previous
+    with tempfile.TemporaryDirectory() as tdir:
+        copy = shutil.copy(head / "instrument.json", tdir)
+        with pytest.raises(ValueError, match="attune.load"):
+            attune.open(copy)
@@ -0,0 +1,107 @@
+import asyncio
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+
+import attune
+
+here = pathlib.Path(__file__).parent
+
+
+def temp_store(func):
+    def inner():
+        with tempfile.TemporaryDirectory() as tdir:
+            shutil.copytree(here / "example_store", tdir + "/example_store")
+            os.environ["ATTUNE_STORE"] = tdir + "/example_store"
+            func()
+
+    return inner
+
+
+@temp_store
+def test_watch():
+    received = [[], []]
+    events = [threading.Event(), threading.Event()]
+
+    def callback(i):
+        def inner(instr):
+            received[i].append(instr)
+            events[i].set()
+
+        return inner
+
+    with attune.watch("test", callback(0), interval=0.01):
+        with attune.watch("test", callback(1), interval=0.01):
+            new = attune.offset_by(attune.load("test"), "arr", "tune", 1.0)
+            attune.store(new)
+            assert events[0].wait(5) and events[1].wait(5)
+    assert received[0] == [new]
+    # the new head is loaded once, for all watches
+    assert received[1][0] is received[0][0]
+    assert received[0][0].load == attune.load("test").load
+    assert (pathlib.Path(os.environ["ATTUNE_STORE"]) / "test" / "HEAD").exists()
+
+
+@temp_store
+def test_watch_stop():
+    received = []
+    watch = attune.watch("test", received.append, interval=0.01)
+    watch.stop()
+    attune.store(attune.offset_by(attune.load("test"), "arr", "tune", 1.0))
+    threading.Event().wait(0.1)
+    assert received == []
+
+
+@temp_store
+def test_watch_read_error():
+    from attune import _watch
+
+    read_instr = _watch._read_instr
+    failures = []
+
+    def flaky(version, **kwargs):
+        # the first read fails, as if the version was moved by a concurrent compact
+        if not failures:
+            failures.append(version)
+            raise FileNotFoundError(version.path)
+        return read_instr(version, **kwargs)
+
+    received = []
+    event = threading.Event()
+
+    def callback(instr):
+        received.append(instr)
+        event.set()
+
+    _watch._read_instr = flaky
+    try:
+        with attune.watch("test", callback, interval=0.01):
+            new = attune.offset_by(attune.load("test"), "arr", "tune", 1.0)
+            attune.store(new)
+            assert event.wait(5)
+    finally:
+        _watch._read_instr = read_instr
+    assert failures
+    assert received == [new]
+
+
+@temp_store
+def test_awatch():
+    async def main():
+        instr = attune.load("test")
+        stored = []
+        watch = attune.awatch("test", interval=0.01)
+        received = asyncio.ensure_future(watch.__anext__())
+        await asyncio.sleep(0.05)
+        for amount in (1.0, 2.0):
+            instr = attune.offset_by(instr, "arr", "tune", amount)
+            attune.store(instr)
+            stored.append(instr)
+            await asyncio.sleep(0.05)
+        assert await asyncio.wait_for(received, 5) == stored[0]
+        assert await asyncio.wait_for(watch.__anext__(), 5) == stored[1]
+        await watch.aclose()
+
+    asyncio.run(main())
@@ -4,7 +4,6 @@ import pathlib
 import numpy as np
 import WrightTools as wt
 
-
 __here__ = pathlib.Path(__file__).parent
 
 
@@ -42,6 +41,32 @@ def test_ltol_with_gtol():
     assert np.allclose(new["sig"]["d2"].independent, correct["sig"]["d2"].independent)
 
 
+def test_synthetic_instrument():
+    # the tune points of an instrument are read only, the workup must not sort them in place
+    w1 = np.linspace(1300, 1400, 11)
+    d2 = np.linspace(-1, 1, 21)
+    data = wt.Data()
+    data.create_variable("w1", w1[:, None], units="nm")
+    data.create_variable("d2", d2[None, :])
+    data.create_channel("sig", np.exp(-((d2[None, :] - 0.2) ** 2) / 0.1) * np.ones((11, 1)))
+    data.transform("w1", "d2")
+    tune = attune.Tune(w1[::-1], np.zeros(11))
+    old = attune.Instrument({"sig": attune.Arrangement("sig", {"d2": tune})})
+    new, _ = attune.intensity(
+        data=data,
+        channel="sig",
+        arrangement="sig",
+        tune="d2",
+        instrument=old,
+        plot=False,
+        autosave=False,
+    )
+    np.testing.assert_allclose(new["sig"]["d2"].independent, w1)
+    np.testing.assert_allclose(new["sig"]["d2"].dependent, 0.2, atol=0.01)
+    np.testing.assert_array_equal(old["sig"]["d2"].independent, w1)
+
+
 if __name__ == "__main__":
     test()
     test_ltol_with_gtol()
+    test_synthetic_instrument()
@@ -1,10 +1,11 @@
 import attune
 import pathlib
+
+import numpy as np
 import WrightTools as wt
 
 import matplotlib.pyplot as plt
 
-
 __here__ = pathlib.Path(__file__).parent
 
 
@@ -29,5 +30,29 @@ def test():
     assert new == reference
 
 
+def test_synthetic_instrument():
+    # the tune points of an instrument are read only, the workup must not sort them in place
+    w1 = np.linspace(1300, 1400, 11)
+    d2 = np.linspace(-1, 1, 21)
+    data = wt.Data()
+    data.create_variable("w1", w1[:, None], units="nm")
+    data.create_variable("d2", d2[None, :])
+    data.create_channel("color", w1[:, None] + 10 * (d2[None, :] - 0.3))
+    data.transform("w1", "d2")
+    old = attune.Instrument({"sig": attune.Arrangement("sig", {"d2": attune.Tune(w1, 0 * w1)})})
+    new, _ = attune.setpoint(
+        data=data,
+        channel="color",
+        arrangement="sig",
+        tune="d2",
+        instrument=old,
+        plot=False,
+        autosave=False,
+    )
+    np.testing.assert_allclose(new["sig"]["d2"].independent, w1)
+    np.testing.assert_allclose(new["sig"]["d2"].dependent, 0.3, atol=0.01)
+
+
 if __name__ == "__main__":
     test()
+    test_synthetic_instrument()
@@ -2,6 +2,7 @@ import attune
 import WrightTools as wt
 import numpy as np
 import pathlib
+import tempfile
 
 
 __here__ = pathlib.Path(__file__).parent
@@ -20,3 +21,30 @@ def test_tune_test():
     for tune, correct in zip(out["sfs"].values(), correct_out["sfs"].values()):
         assert np.allclose(tune.dependent, correct.dependent, atol=0.01)
         assert np.allclose(tune.independent, correct.independent, atol=0.01)
+
+
+def test_tune_test_headless():
+    import matplotlib.pyplot as plt
+
+    d = wt.open(__here__ / "tunetest.wt5")
+    instr = attune.open(__here__ / "instrument_in.json")
+    d.transform("w3", "wm-w3")
+    figures = plt.get_fignums()
+    with tempfile.TemporaryDirectory() as tdir:
+        out, report = attune.tune_test(
+            data=d,
+            channel="signal_mean",
+            arrangement="sfs",
+            instrument=instr,
+            save_directory=tdir,
+            plot=False,
+        )
+        assert plt.get_fignums() == figures
+        assert sorted(p.name for p in pathlib.Path(tdir).iterdir()) == ["instrument.json"]
+        assert report.save(tdir) == pathlib.Path(tdir) / "tune_test.png"
+        assert (pathlib.Path(tdir) / "tune_test.png").exists()
+        assert plt.get_fignums() == figures
+
+    correct_out = attune.open(__here__ / "instrument_out.json")
+    for tune, correct in zip(out["sfs"].values(), correct_out["sfs"].values()):
+        assert np.allclose(tune.dependent, correct.dependent, atol=0.01)